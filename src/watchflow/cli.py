@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
+from rich import get_console
 from rich.prompt import Confirm, Prompt
 
 from watchflow import __version__
@@ -21,14 +21,15 @@ from watchflow.exceptions import (
 )
 from watchflow.ui.renderer import UIRenderer
 from watchflow.utils.logger import setup_logging
-from watchflow.utils.templates import CONFIG_TEMPLATES, TemplateEngine
+from watchflow.utils.templates import CONFIG_TEMPLATES, render_config
 
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
-        console = Console()
-        console.print(f"[bold cyan]WatchFlow[/bold cyan] version [bold]{__version__}[/bold]")
+        get_console().print(
+            f"[bold cyan]WatchFlow[/bold cyan] version [bold]{__version__}[/bold]"
+        )
         raise typer.Exit()
 
 
@@ -371,7 +372,7 @@ def _generate_config(
     Returns:
         Configuration content as string
     """
-    template = CONFIG_TEMPLATES.get(language, CONFIG_TEMPLATES["python"])
+    template_name = language if language in CONFIG_TEMPLATES else "python"
 
     # Determine commands based on language and package manager
     variables = {
@@ -388,7 +389,7 @@ def _generate_config(
         build_cmd = "mvn" if package_manager == "maven" else "gradle"
         variables["build_cmd"] = f'"{build_cmd}"'
 
-    return TemplateEngine.substitute(template, variables)
+    return render_config(template_name, variables)
 
 
 if __name__ == "__main__":
@@ -39,6 +39,8 @@ class Command(BaseModel):
         None, description="Only run if these patterns changed"
     )
 
+    model_config = {"defer_build": True}
+
     @field_validator("cmd")
     @classmethod
     def validate_cmd(cls, v: list[str]) -> list[str]:
@@ -68,6 +70,8 @@ class Watcher(BaseModel):
     commands: list[Command] = Field(..., description="Commands to execute")
     parallel: bool = Field(False, description="Execute commands in parallel")
 
+    model_config = {"defer_build": True, "revalidate_instances": "never"}
+
     @field_validator("paths")
     @classmethod
     def validate_paths(cls, v: list[str]) -> list[str]:
@@ -98,7 +102,7 @@ class GlobalConfig(BaseModel):
     )
     log_level: str = Field("INFO", description="Logging level")
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "defer_build": True}
 
 
 class Config(BaseModel):
@@ -127,7 +131,13 @@ class Config(BaseModel):
     def handle_global_alias(cls, data: Any) -> Any:
         """Handle 'global' field alias."""
         if isinstance(data, dict) and "global" in data:
+            # Copy so the caller's mapping is left untouched
+            data = dict(data)
             data["global_config"] = data.pop("global")
         return data
 
-    model_config = {"populate_by_name": True}
+    model_config = {
+        "populate_by_name": True,
+        "defer_build": True,
+        "revalidate_instances": "never",
+    }
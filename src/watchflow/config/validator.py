@@ -2,11 +2,13 @@
 
 import os
 import re
+from collections.abc import Iterator
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from watchflow.config.models import Config
 from watchflow.exceptions import (
@@ -15,15 +17,85 @@ from watchflow.exceptions import (
     ConfigValidationError,
 )
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 # Pattern for environment variable expansion: ${VAR} or ${VAR:-default}
 ENV_VAR_PATTERN = re.compile(r"\$\{([^}:]+)(?::-([^}]*))?\}")
 
 
+def _replace_env_var(match: re.Match[str]) -> str:
+    """Resolve a single ${VAR} or ${VAR:-default} match.
+
+    Args:
+        match: Match produced by ENV_VAR_PATTERN
+
+    Returns:
+        Environment value, default, or the original text if neither exists
+    """
+    env_value = os.environ.get(match.group(1))
+    if env_value is not None:
+        return env_value
+    default = match.group(2)
+    if default is not None:
+        return default
+    return match.group(0)  # Keep original if no match and no default
+
+
+def _expand_string(value: str) -> str:
+    """Expand environment variables in a single string.
+
+    Args:
+        value: String that may contain ${VAR} references
+
+    Returns:
+        String with environment variables expanded
+    """
+    if "${" not in value:
+        return value
+    return ENV_VAR_PATTERN.sub(_replace_env_var, value)
+
+
+class _ExpansionFrame:
+    """A list or dict being walked by expand_env_vars."""
+
+    __slots__ = ("copy", "items", "key", "original")
+
+    def __init__(self, original: list[Any] | dict[Any, Any], key: Any = None):
+        """Initialize frame.
+
+        Args:
+            original: Container being expanded
+            key: Key or index of the container within its parent
+        """
+        self.original = original
+        self.key = key
+        self.items: Iterator[tuple[Any, Any]] = iter(
+            original.items() if isinstance(original, dict) else enumerate(original)
+        )
+        self.copy: list[Any] | dict[Any, Any] | None = None
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store an expanded child, copying the container on first change."""
+        if self.copy is None:
+            self.copy = (
+                dict(self.original)
+                if isinstance(self.original, dict)
+                else list(self.original)
+            )
+        self.copy[key] = value
+
+    def result(self) -> list[Any] | dict[Any, Any]:
+        """Get the expanded container."""
+        return self.original if self.copy is None else self.copy
+
+
 def expand_env_vars(value: Any) -> Any:
-    """Recursively expand environment variables in configuration values.
+    """Expand environment variables in configuration values.
 
-    Supports ${VAR} and ${VAR:-default} syntax.
+    Supports ${VAR} and ${VAR:-default} syntax. Nested lists and dicts are
+    walked iteratively, and a container is only copied when something inside
+    it actually changes; unchanged containers are returned as-is.
 
     Args:
         value: Configuration value (string, list, or dict)
@@ -32,23 +104,54 @@ def expand_env_vars(value: Any) -> Any:
         Value with environment variables expanded
     """
     if isinstance(value, str):
+        return _expand_string(value)
+    if not isinstance(value, (list, dict)):
+        return value
 
-        def replacer(match: re.Match[str]) -> str:
-            var_name = match.group(1)
-            default = match.group(2)
-            env_value = os.environ.get(var_name)
-            if env_value is not None:
-                return env_value
-            if default is not None:
-                return default
-            return match.group(0)  # Keep original if no match and no default
+    stack = [_ExpansionFrame(value)]
+    while True:
+        frame = stack[-1]
+        for key, item in frame.items:
+            if isinstance(item, str):
+                expanded = _expand_string(item)
+                if expanded is not item:
+                    frame.set(key, expanded)
+            elif isinstance(item, (list, dict)):
+                stack.append(_ExpansionFrame(item, key))
+                break
+        else:
+            stack.pop()
+            result = frame.result()
+            if not stack:
+                return result
+            if result is not frame.original:
+                stack[-1].set(frame.key, result)
 
-        return ENV_VAR_PATTERN.sub(replacer, value)
-    elif isinstance(value, list):
-        return [expand_env_vars(item) for item in value]
-    elif isinstance(value, dict):
-        return {k: expand_env_vars(v) for k, v in value.items()}
-    return value
+
+@cache
+def _config_adapter() -> TypeAdapter[Config]:
+    """Get the shared adapter used to validate raw configuration data.
+
+    Returns:
+        TypeAdapter for the root Config model
+    """
+    return TypeAdapter(Config)
+
+
+def _format_validation_errors(error: ValidationError) -> list[str]:
+    """Format pydantic validation errors as "location: message" strings.
+
+    Args:
+        error: Validation error raised by pydantic
+
+    Returns:
+        List of human-readable error messages
+    """
+    errors = []
+    for detail in error.errors():
+        loc = " -> ".join(str(loc_part) for loc_part in detail["loc"])
+        errors.append(f"{loc}: {detail['msg']}")
+    return errors
 
 
 class ConfigValidator:
@@ -73,9 +176,47 @@ class ConfigValidator:
         if not config_path.exists():
             raise ConfigNotFoundError(str(config_path))
 
+        return ConfigValidator.load_config_bytes(
+            config_path.read_bytes(), expand_env=expand_env, path=str(config_path)
+        )
+
+    @staticmethod
+    def load_config_bytes(
+        content: bytes, expand_env: bool = True, path: str | None = None
+    ) -> Config:
+        """Load and validate configuration from raw file content.
+
+        JSON documents (a subset of YAML) with nothing to expand are validated
+        directly by pydantic's JSON parser, skipping the YAML parser and the
+        intermediate dict. Everything else is parsed as YAML.
+
+        Args:
+            content: Raw configuration file content
+            expand_env: Whether to expand environment variables (default: True)
+            path: Path the content was read from, for error messages (optional)
+
+        Returns:
+            Validated Config object
+
+        Raises:
+            ConfigSyntaxError: If YAML is malformed
+            ConfigValidationError: If config is invalid
+        """
+        stripped = content.strip()
+        if stripped.startswith(b"{") and (not expand_env or b"${" not in content):
+            if stripped.endswith(b"}") and not stripped[1:-1].strip():
+                # "{}" is as empty as a blank YAML document
+                raise ConfigValidationError(["Configuration file is empty"], path=path)
+            try:
+                return _config_adapter().validate_json(content)
+            except ValidationError as e:
+                if not any(error["type"] == "json_invalid" for error in e.errors()):
+                    errors = _format_validation_errors(e)
+                    raise ConfigValidationError(errors, path=path) from e
+                # Not strict JSON (e.g. a YAML flow mapping), parse as YAML
+
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = yaml.load(content, Loader=_YAML_LOADER)
         except yaml.YAMLError as e:
             # Try to extract line number from YAML error
             line = None
@@ -84,23 +225,17 @@ class ConfigValidator:
             raise ConfigSyntaxError(str(e), line=line) from e
 
         if not data:
-            raise ConfigValidationError(
-                ["Configuration file is empty"], path=str(config_path)
-            )
+            raise ConfigValidationError(["Configuration file is empty"], path=path)
 
         # Expand environment variables if enabled
         if expand_env:
             data = expand_env_vars(data)
 
         try:
-            return Config(**data)
+            return _config_adapter().validate_python(data)
         except ValidationError as e:
-            errors = []
-            for error in e.errors():
-                loc = " -> ".join(str(loc_part) for loc_part in error["loc"])
-                msg = error["msg"]
-                errors.append(f"{loc}: {msg}")
-            raise ConfigValidationError(errors, path=str(config_path)) from e
+            errors = _format_validation_errors(e)
+            raise ConfigValidationError(errors, path=path) from e
 
     @staticmethod
     def save_config(config: Config, config_path: Path) -> None:
@@ -131,12 +266,7 @@ class ConfigValidator:
             Tuple of (is_valid, error_messages)
         """
         try:
-            Config(**data)
+            _config_adapter().validate_python(data)
             return True, []
         except ValidationError as e:
-            errors = []
-            for error in e.errors():
-                loc = " -> ".join(str(loc_part) for loc_part in error["loc"])
-                msg = error["msg"]
-                errors.append(f"{loc}: {msg}")
-            return False, errors
+            return False, _format_validation_errors(e)
@@ -106,7 +106,8 @@ class WatchFlowEngine:
                 self.config = new_config
                 self._config_hash = new_hash
 
-                # Recreate executor with new settings
+                # Recreate executor with new settings; tools may have moved
+                CommandExecutor.clear_command_cache()
                 self.executor = CommandExecutor(
                     max_parallel=new_config.global_config.max_parallel_commands
                 )
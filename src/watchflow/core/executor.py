@@ -1,11 +1,14 @@
 """Command execution engine."""
 
 import asyncio
+import contextlib
+import os
 import shutil
 import subprocess
+import sys
 import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 from watchflow.config.models import Command, RetryStrategy
 from watchflow.utils.logger import get_logger
@@ -13,6 +16,11 @@ from watchflow.utils.templates import TemplateEngine
 
 logger = get_logger(__name__)
 
+# Buffer limit for subprocess output streams. communicate() only pauses the
+# pipe once this much is buffered, so larger outputs need fewer
+# pause/resume round trips than with asyncio's 64 KiB default.
+SUBPROCESS_STREAM_LIMIT = 1 << 20
+
 
 class CommandNotFoundError(Exception):
     """Raised when a command executable is not found."""
@@ -29,16 +37,50 @@ class CommandNotFoundError(Exception):
         super().__init__(f"Command not found: {command}")
 
 
+# Resolved command paths keyed by (command, PATH); misses are never stored so
+# tools installed while watching are found, and only absolute paths are kept
+_WHICH_CACHE: dict[tuple[str, str], str] = {}
+_WHICH_CACHE_SIZE = 256
+
+
+def _which(cmd: str, search_path: str) -> str | None:
+    """Resolve a command against a PATH value, caching hits.
+
+    Args:
+        cmd: Command name to find
+        search_path: PATH value to search
+
+    Returns:
+        Full path to executable if found, None otherwise
+    """
+    key = (cmd, search_path)
+    cached = _WHICH_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    result = shutil.which(cmd, path=search_path)
+    if result is not None and os.path.isabs(result):
+        if len(_WHICH_CACHE) >= _WHICH_CACHE_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            del _WHICH_CACHE[next(iter(_WHICH_CACHE))]
+        _WHICH_CACHE[key] = result
+    return result
+
+
 def find_command(cmd: str) -> Optional[str]:
     """Find command executable in PATH.
 
+    Found commands are cached per command name and PATH value, so repeated
+    validation doesn't rescan every PATH directory. Call
+    CommandExecutor.clear_command_cache() after moving or removing tools.
+
     Args:
         cmd: Command name to find
 
     Returns:
         Full path to executable if found, None otherwise
     """
-    return shutil.which(cmd)
+    return _which(cmd, os.environ.get("PATH", os.defpath))
 
 
 def validate_command(cmd_list: list[str]) -> tuple[bool, Optional[str]]:
@@ -96,6 +138,14 @@ class ExecutionResult:
 class CommandExecutor:
     """Executes commands with retry logic and timeouts."""
 
+    # Retry delays in seconds by attempt; the last entry repeats from there on
+    RETRY_DELAYS: ClassVar[dict[RetryStrategy, tuple[float, ...]]] = {
+        # Fixed delay: 1 second
+        RetryStrategy.FIXED: (1.0,),
+        # Exponential backoff: 1s, 2s, 4s, 8s, ..., capped at 60 seconds
+        RetryStrategy.EXPONENTIAL: (1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 60.0),
+    }
+
     def __init__(self, max_parallel: int = 4, validate_commands: bool = True):
         """Initialize executor.
 
@@ -107,6 +157,11 @@ class CommandExecutor:
         self.validate_commands = validate_commands
         self.semaphore = asyncio.Semaphore(max_parallel)
 
+    @staticmethod
+    def clear_command_cache() -> None:
+        """Forget cached PATH lookups made by find_command."""
+        _WHICH_CACHE.clear()
+
     async def execute_command(
         self,
         command: Command,
@@ -142,8 +197,6 @@ class CommandExecutor:
             cmd_list = TemplateEngine.substitute_list(command.cmd, template_vars)
 
             # Validate command exists (skip on Windows where shell=True handles it)
-            import sys
-
             if self.validate_commands and sys.platform != "win32":
                 is_valid, error = validate_command(cmd_list)
                 if not is_valid:
@@ -270,13 +323,30 @@ class CommandExecutor:
             List of ExecutionResults
         """
         if parallel:
-            # Execute all commands in parallel
-            tasks = [
-                self.execute_command(cmd, template_vars, project_root)
-                for cmd in commands
-            ]
-            results = await asyncio.gather(*tasks)
-            return list(results)
+            # A fixed pool of workers pulls from a shared iterator, so at most
+            # max_parallel tasks exist no matter how many commands there are
+            results: dict[int, ExecutionResult] = {}
+            pending = iter(enumerate(commands))
+
+            async def worker() -> None:
+                for index, cmd in pending:
+                    results[index] = await self.execute_command(
+                        cmd, template_vars, project_root
+                    )
+
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for _ in range(min(len(commands), self.max_parallel)):
+                        group.create_task(worker())
+            except BaseExceptionGroup as error_group:
+                # Callers handle the failing command's own error, not the group
+                error: BaseException = error_group
+                while isinstance(error, BaseExceptionGroup):
+                    error = error.exceptions[0]
+            else:
+                return [results[index] for index in range(len(commands))]
+            # Raised outside the handler so the error keeps its own cause
+            raise error
         else:
             # Execute commands sequentially
             result_list: list[ExecutionResult] = []
@@ -302,8 +372,6 @@ class CommandExecutor:
             CompletedProcess with result
         """
         # On Windows, we need shell=True for built-in commands like echo
-        import sys
-
         use_shell = sys.platform == "win32"
 
         if use_shell:
@@ -317,6 +385,7 @@ class CommandExecutor:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=working_dir,
+                limit=SUBPROCESS_STREAM_LIMIT,
             )
         else:
             process = await asyncio.create_subprocess_exec(
@@ -324,13 +393,14 @@ class CommandExecutor:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=working_dir,
+                limit=SUBPROCESS_STREAM_LIMIT,
             )
 
         try:
-            stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                process.communicate(),
-                timeout=timeout,
-            )
+            # asyncio.timeout cancels communicate() in place, without the
+            # extra wrapper task wait_for needs on older Pythons
+            async with asyncio.timeout(timeout):
+                stdout_bytes, stderr_bytes = await process.communicate()
 
             # Note: We need to check the actual return code from the result
             actual_returncode = (
@@ -344,9 +414,13 @@ class CommandExecutor:
                 stderr=stderr_bytes.decode("utf-8", errors="replace"),
             )
 
-        except asyncio.TimeoutError:
-            # Kill process on timeout
-            process.kill()
+        except (TimeoutError, asyncio.CancelledError):
+            # SIGKILL straight away; no terminate-then-kill escalation. A
+            # cancelled sibling in a parallel batch must not leave its child
+            # running unreaped either
+            # The process may have exited between the deadline and the kill
+            with contextlib.suppress(ProcessLookupError):
+                process.kill()
             await process.wait()
             raise
 
@@ -414,9 +488,5 @@ class CommandExecutor:
         Returns:
             Delay in seconds
         """
-        if strategy == RetryStrategy.EXPONENTIAL:
-            # Exponential backoff: 1s, 2s, 4s, 8s, ...
-            return min(2**attempt, 60)  # Cap at 60 seconds
-        else:
-            # Fixed delay: 1 second
-            return 1.0
+        delays = self.RETRY_DELAYS[strategy]
+        return delays[min(attempt, len(delays) - 1)]
@@ -15,22 +15,30 @@ from watchflow.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _new_hasher() -> "hashlib._Hash":
+    """Create the hash object used for file change detection.
+
+    Returns:
+        SHA-256 hasher flagged as not used for security, so FIPS-restricted
+        OpenSSL builds don't reject or slow it down
+    """
+    return hashlib.sha256(usedforsecurity=False)
+
+
 def compute_file_hash(path: str) -> Optional[str]:
-    """Compute MD5 hash of a file for change detection.
+    """Compute SHA-256 hash of a file for change detection.
 
     Args:
         path: Path to the file
 
     Returns:
-        MD5 hash string or None if file cannot be read
+        64-character hex digest or None if file cannot be read
     """
     try:
         with open(path, "rb") as f:
-            # Read in chunks for large files
-            hasher = hashlib.md5()
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
-            return hasher.hexdigest()
+            # file_digest streams through a reusable buffer in C; unlike a
+            # memory map it is safe on files truncated while being written
+            return hashlib.file_digest(f, _new_hasher).hexdigest()
     except (OSError, IOError):
         return None
 
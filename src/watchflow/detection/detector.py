@@ -1,8 +1,11 @@
 """Project type detection."""
 
+import fnmatch
+import os
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
 
 
 @dataclass
@@ -98,6 +101,40 @@ class ProjectDetector:
         },
     }
 
+    # Every marker name per language, for a single set test per language
+    LANGUAGE_MARKERS: ClassVar[dict[str, frozenset[str]]] = {
+        language: frozenset(file for files, _ in patterns for file in files)
+        for language, patterns in DETECTION_PATTERNS.items()
+    }
+
+    # Test framework markers per language; may be globs or nested paths
+    TEST_FRAMEWORKS: ClassVar[dict[str, list[tuple[str, tuple[str, ...]]]]] = {
+        "python": [
+            ("pytest", ("pytest.ini", "pyproject.toml")),
+            ("unittest", ("test_*.py", "tests/")),
+        ],
+        "nodejs": [
+            ("jest", ("jest.config.js", "jest.config.ts")),
+            ("vitest", ("vitest.config.ts",)),
+            ("mocha", (".mocharc.json",)),
+        ],
+        "go": [
+            ("go test", ("*_test.go",)),
+        ],
+        "rust": [
+            ("cargo test", ("tests/",)),
+        ],
+        "java": [
+            ("junit", ("src/test/",)),
+        ],
+        "ruby": [
+            ("rspec", (".rspec", "spec/")),
+        ],
+        "php": [
+            ("phpunit", ("phpunit.xml",)),
+        ],
+    }
+
     def __init__(self, project_path: Path):
         """Initialize detector.
 
@@ -105,45 +142,96 @@ class ProjectDetector:
             project_path: Path to project directory
         """
         self.project_path = project_path
+        self._entries: frozenset[str] | None = None
 
-    def detect_all(self) -> list[ProjectDetection]:
-        """Detect all project types in directory.
+    def _get_entries(self) -> frozenset[str]:
+        """Get names of entries in the project directory.
+
+        The directory is listed once with a single scandir call and the
+        result is reused for every marker check made by this detector.
 
         Returns:
-            List of detected projects, sorted by confidence
+            Frozen set of entry names (empty if the directory can't be read)
         """
-        detections: list[ProjectDetection] = []
+        if self._entries is None:
+            try:
+                with os.scandir(self.project_path) as it:
+                    self._entries = frozenset(entry.name for entry in it)
+            except OSError:
+                self._entries = frozenset()
+        return self._entries
 
-        for language, patterns in self.DETECTION_PATTERNS.items():
-            confidence = 0.0
-            detected_files: list[str] = []
+    @staticmethod
+    @cache
+    def _split_markers(
+        markers: tuple[str, ...],
+    ) -> tuple[frozenset[str], tuple[str, ...], tuple[str, ...]]:
+        """Split markers by how they have to be checked.
 
-            for files, boost in patterns:
-                for file in files:
-                    if (self.project_path / file).exists():
-                        confidence += boost
-                        detected_files.append(file)
+        Args:
+            markers: File names, directory names (trailing slash), glob
+                patterns, or nested paths
 
-            if confidence > 0:
-                # Normalize confidence to 0-1 range (more generous scoring)
-                normalized_confidence = min(confidence / 1.5, 1.0)
-
-                package_manager = self._detect_package_manager(language)
-                test_framework = self._detect_test_framework(language)
-
-                detections.append(
-                    ProjectDetection(
-                        language=language,
-                        confidence=normalized_confidence,
-                        detected_files=detected_files,
-                        package_manager=package_manager,
-                        test_framework=test_framework,
-                    )
-                )
+        Returns:
+            Tuple of (plain names, glob patterns, nested paths)
+        """
+        names: set[str] = set()
+        patterns: list[str] = []
+        nested: list[str] = []
+        for marker in markers:
+            name = marker.rstrip("/")
+            if "/" in name:
+                nested.append(name)
+            elif "*" in name or "?" in name or "[" in name:
+                patterns.append(name)
+            else:
+                names.add(name)
+        return frozenset(names), tuple(patterns), tuple(nested)
 
-        # Sort by confidence descending
-        detections.sort(key=lambda x: x.confidence, reverse=True)
-        return detections
+    def _has_any_marker(self, markers: tuple[str, ...]) -> bool:
+        """Check whether any marker file, directory, or glob exists.
+
+        Plain names are answered by one set operation on the directory
+        listing and globs are matched against it; only nested paths such as
+        src/test/ need a filesystem check.
+
+        Args:
+            markers: File names, directory names (trailing slash), glob
+                patterns, or nested paths
+
+        Returns:
+            True if at least one marker is present in the project directory
+        """
+        names, patterns, nested = self._split_markers(markers)
+        entries = self._get_entries()
+        if not names.isdisjoint(entries):
+            return True
+        if any(
+            fnmatch.fnmatchcase(entry, pattern)
+            for pattern in patterns
+            for entry in entries
+        ):
+            return True
+        return any((self.project_path / name).exists() for name in nested)
+
+    def detect_all(self) -> list[ProjectDetection]:
+        """Detect all project types in directory.
+
+        Returns:
+            List of detected projects, sorted by confidence
+        """
+        return [
+            ProjectDetection(
+                language=language,
+                confidence=confidence,
+                detected_files=list(detected_files),
+                package_manager=package_manager,
+                test_framework=self._detect_test_framework(language),
+            )
+            for language, confidence, detected_files, package_manager in (
+                self._score_entries(self._get_entries())
+            )
+        ]
 
     def detect_primary(self) -> Optional[ProjectDetection]:
         """Detect primary project type.
@@ -154,23 +242,61 @@ class ProjectDetector:
         detections = self.detect_all()
         return detections[0] if detections else None
 
-    def _detect_package_manager(self, language: str) -> Optional[str]:
-        """Detect package manager for language.
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _score_entries(
+        cls, entries: frozenset[str]
+    ) -> tuple[tuple[str, float, tuple[str, ...], str | None], ...]:
+        """Score languages and package managers for a directory listing.
+
+        DETECTION_PATTERNS and PACKAGE_MANAGERS only name top-level entries,
+        so the result depends on the listing alone and is memoized per
+        distinct directory layout.
 
         Args:
-            language: Project language
+            entries: Names of entries in the project directory
 
         Returns:
-            Package manager name or None
+            Tuples of (language, confidence, detected_files, package_manager)
+            for every language with at least one marker present, sorted by
+            confidence
         """
-        managers = self.PACKAGE_MANAGERS.get(language, {})
+        scores = []
 
-        for manager, files in managers.items():
-            for file in files:
-                if (self.project_path / file).exists():
-                    return manager
+        for language, patterns in cls.DETECTION_PATTERNS.items():
+            hits = cls.LANGUAGE_MARKERS[language] & entries
+            if not hits:
+                continue
 
-        return None
+            confidence = 0.0
+            detected_files: list[str] = []
+
+            for files, boost in patterns:
+                for file in files:
+                    if file in hits:
+                        confidence += boost
+                        detected_files.append(file)
+
+            if confidence > 0:
+                package_manager = None
+                for manager, files in cls.PACKAGE_MANAGERS.get(language, {}).items():
+                    if not entries.isdisjoint(files):
+                        package_manager = manager
+                        break
+
+                # Normalize confidence to 0-1 range (more generous scoring)
+                scores.append(
+                    (
+                        language,
+                        min(confidence / 1.5, 1.0),
+                        tuple(detected_files),
+                        package_manager,
+                    )
+                )
+
+        # Sort by confidence descending
+        scores.sort(key=lambda score: score[1], reverse=True)
+        return tuple(scores)
 
     def _detect_test_framework(self, language: str) -> Optional[str]:
         """Detect test framework for language.
@@ -181,39 +307,8 @@ class ProjectDetector:
         Returns:
             Test framework name or None
         """
-        test_patterns = {
-            "python": [
-                ("pytest", ["pytest.ini", "pyproject.toml"]),
-                ("unittest", ["test_*.py", "tests/"]),
-            ],
-            "nodejs": [
-                ("jest", ["jest.config.js", "jest.config.ts"]),
-                ("vitest", ["vitest.config.ts"]),
-                ("mocha", [".mocharc.json"]),
-            ],
-            "go": [
-                ("go test", ["*_test.go"]),
-            ],
-            "rust": [
-                ("cargo test", ["tests/"]),
-            ],
-            "java": [
-                ("junit", ["src/test/"]),
-            ],
-            "ruby": [
-                ("rspec", [".rspec", "spec/"]),
-            ],
-            "php": [
-                ("phpunit", ["phpunit.xml"]),
-            ],
-        }
-
-        frameworks = test_patterns.get(language, [])
-
-        for framework, files in frameworks:
-            for file in files:
-                path = self.project_path / file
-                if path.exists() or list(self.project_path.glob(file)):
-                    return framework
+        for framework, markers in self.TEST_FRAMEWORKS.get(language, ()):
+            if self._has_any_marker(markers):
+                return framework
 
         return None
@@ -1,11 +1,14 @@
 """Tool detection and validation."""
 
+import os
 import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
+from typing import ClassVar, Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolInfo:
     """Tool information."""
 
@@ -15,36 +18,107 @@ class ToolInfo:
     install_hint: Optional[str] = None
 
 
+# Probe results for available tools keyed by (tool, version command, PATH), so
+# changing PATH probes again. Missing tools are never stored, so tools
+# installed while watching are found; a plain dict lets callers see which
+# probes are still needed
+_PROBE_CACHE: dict[tuple[str, str | None, str | None], tuple[bool, str | None]] = {}
+_PROBE_CACHE_SIZE = 256
+
+
+def _probe_tool(
+    tool_name: str, version_cmd: str | None, search_path: str | None
+) -> tuple[bool, str | None]:
+    """Check a tool's availability and version, memoized.
+
+    Args:
+        tool_name: Name of the tool
+        version_cmd: Command to check version (optional)
+        search_path: PATH value to search
+
+    Returns:
+        Tuple of (available, version)
+    """
+    key = (tool_name, version_cmd, search_path)
+    cached = _PROBE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    # Missing tools are settled by the PATH lookup alone, without spawning
+    tool_path = shutil.which(tool_name, path=search_path)
+    available = tool_path is not None
+    version = None
+
+    if tool_path and version_cmd:
+        args = version_cmd.split()
+        if args[0] == tool_name:
+            # Exec the resolved file instead of searching PATH a second time
+            args[0] = tool_path
+        try:
+            # Only stdout is parsed, so stderr needs no pipe of its own
+            result = subprocess.run(
+                args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=5,
+                start_new_session=True,
+            )
+            if result.returncode == 0:
+                # Extract version from output (first line usually)
+                version = result.stdout.strip().split("\n")[0]
+        except (subprocess.SubprocessError, OSError):
+            pass
+
+    if available:
+        if len(_PROBE_CACHE) >= _PROBE_CACHE_SIZE:
+            # Evict the oldest entry; probes may race here from worker threads
+            _PROBE_CACHE.pop(next(iter(_PROBE_CACHE)), None)
+        _PROBE_CACHE[key] = (available, version)
+    return available, version
+
+
 class ToolDetector:
     """Detects and validates development tools."""
 
-    TOOL_REQUIREMENTS = {
-        "python": [
-            ("python", "python --version", "Install from python.org"),
-            ("pip", "pip --version", "Install from python.org"),
-        ],
-        "nodejs": [
-            ("node", "node --version", "Install from nodejs.org"),
-            ("npm", "npm --version", "Included with Node.js"),
-        ],
-        "go": [
-            ("go", "go version", "Install from go.dev"),
-        ],
-        "rust": [
-            ("cargo", "cargo --version", "Install from rustup.rs"),
-            ("rustc", "rustc --version", "Install from rustup.rs"),
-        ],
-        "java": [
-            ("java", "java -version", "Install JDK from adoptium.net"),
-            ("javac", "javac -version", "Install JDK from adoptium.net"),
-        ],
-        "ruby": [
-            ("ruby", "ruby --version", "Install from ruby-lang.org"),
-            ("gem", "gem --version", "Included with Ruby"),
-        ],
-        "php": [
-            ("php", "php --version", "Install from php.net"),
-        ],
+    # Per language, parallel tuples of tool names, version commands, and
+    # install hints; name lookups only need to touch the "names" column
+    TOOL_REQUIREMENTS: ClassVar[dict[str, dict[str, tuple[str, ...]]]] = {
+        "python": {
+            "names": ("python", "pip"),
+            "version_cmds": ("python --version", "pip --version"),
+            "hints": ("Install from python.org", "Install from python.org"),
+        },
+        "nodejs": {
+            "names": ("node", "npm"),
+            "version_cmds": ("node --version", "npm --version"),
+            "hints": ("Install from nodejs.org", "Included with Node.js"),
+        },
+        "go": {
+            "names": ("go",),
+            "version_cmds": ("go version",),
+            "hints": ("Install from go.dev",),
+        },
+        "rust": {
+            "names": ("cargo", "rustc"),
+            "version_cmds": ("cargo --version", "rustc --version"),
+            "hints": ("Install from rustup.rs", "Install from rustup.rs"),
+        },
+        "java": {
+            "names": ("java", "javac"),
+            "version_cmds": ("java -version", "javac -version"),
+            "hints": ("Install JDK from adoptium.net", "Install JDK from adoptium.net"),
+        },
+        "ruby": {
+            "names": ("ruby", "gem"),
+            "version_cmds": ("ruby --version", "gem --version"),
+            "hints": ("Install from ruby-lang.org", "Included with Ruby"),
+        },
+        "php": {
+            "names": ("php",),
+            "version_cmds": ("php --version",),
+            "hints": ("Install from php.net",),
+        },
     }
 
     PACKAGE_MANAGER_TOOLS = {
@@ -61,36 +135,37 @@ class ToolDetector:
     }
 
     @staticmethod
-    def check_tool(tool_name: str, version_cmd: Optional[str] = None) -> ToolInfo:
+    def check_tool(
+        tool_name: str,
+        version_cmd: str | None = None,
+        install_hint: str | None = None,
+    ) -> ToolInfo:
         """Check if a tool is available.
 
+        Results for available tools are cached per tool, version command,
+        and PATH; call clear_cache() to probe again after upgrading tools.
+        Missing tools are checked again on every call.
+
         Args:
             tool_name: Name of the tool
             version_cmd: Command to check version (optional)
+            install_hint: Install hint to attach to the result (optional)
 
         Returns:
             ToolInfo with availability and version
         """
-        available = shutil.which(tool_name) is not None
-        version = None
-
-        if available and version_cmd:
-            import subprocess
-
-            try:
-                result = subprocess.run(
-                    version_cmd.split(),
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0:
-                    # Extract version from output (first line usually)
-                    version = result.stdout.strip().split("\n")[0]
-            except (subprocess.SubprocessError, OSError):
-                pass
-
-        return ToolInfo(name=tool_name, available=available, version=version)
+        available, version = _probe_tool(tool_name, version_cmd, os.environ.get("PATH"))
+        return ToolInfo(
+            name=tool_name,
+            available=available,
+            version=version,
+            install_hint=install_hint,
+        )
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget cached tool checks made by check_tool."""
+        _PROBE_CACHE.clear()
 
     @classmethod
     def check_language_tools(cls, language: str) -> list[ToolInfo]:
@@ -102,15 +177,33 @@ class ToolDetector:
         Returns:
             List of ToolInfo for required tools
         """
-        tools = cls.TOOL_REQUIREMENTS.get(language, [])
-        results: list[ToolInfo] = []
+        tools = cls.TOOL_REQUIREMENTS.get(language)
+        if not tools:
+            return []
 
-        for tool_name, version_cmd, install_hint in tools:
-            info = cls.check_tool(tool_name, version_cmd)
-            info.install_hint = install_hint
-            results.append(info)
+        names = tools["names"]
+        version_cmds = tools["version_cmds"]
+        search_path = os.environ.get("PATH")
+        # Missing tools are never cached but need no subprocess, so only
+        # installed tools without a cached probe are worth a thread
+        uncached = [
+            (name, version_cmd)
+            for name, version_cmd in zip(names, version_cmds, strict=True)
+            if (name, version_cmd, search_path) not in _PROBE_CACHE
+            and shutil.which(name, path=search_path)
+        ]
+        if len(uncached) > 1:
+            # Version probes wait on subprocesses, so run them side by side
+            with ThreadPoolExecutor(max_workers=min(8, len(uncached))) as pool:
+                for name, version_cmd in uncached:
+                    pool.submit(_probe_tool, name, version_cmd, search_path)
 
-        return results
+        return [
+            cls.check_tool(name, version_cmd, install_hint)
+            for name, version_cmd, install_hint in zip(
+                names, version_cmds, tools["hints"], strict=True
+            )
+        ]
 
     @classmethod
     def check_package_manager(cls, package_manager: str) -> ToolInfo:
@@ -126,9 +219,7 @@ class ToolDetector:
             tool_name, version_cmd, install_hint = cls.PACKAGE_MANAGER_TOOLS[
                 package_manager
             ]
-            info = cls.check_tool(tool_name, version_cmd)
-            info.install_hint = install_hint
-            return info
+            return cls.check_tool(tool_name, version_cmd, install_hint)
 
         # Fallback for unknown package managers
         return ToolInfo(
@@ -151,10 +242,15 @@ class ToolDetector:
         """
         missing: list[ToolInfo] = []
 
-        # Check language tools
-        for tool in cls.check_language_tools(language):
-            if not tool.available:
-                missing.append(tool)
+        # Only availability matters here, so skip the version probes
+        tools = cls.TOOL_REQUIREMENTS.get(language)
+        if tools:
+            for tool_name, install_hint in zip(
+                tools["names"], tools["hints"], strict=True
+            ):
+                info = cls.check_tool(tool_name, install_hint=install_hint)
+                if not info.available:
+                    missing.append(info)
 
         # Check package manager
         if package_manager:
@@ -4,6 +4,7 @@ import shutil
 import sys
 from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from typing import Generator, Optional
 
 from rich.console import Console
@@ -12,6 +13,7 @@ from rich.panel import Panel
 from rich.spinner import Spinner
 from rich.table import Table
 from rich.text import Text
+from rich.theme import Theme as RichTheme
 
 from watchflow.config.models import Config
 from watchflow.detection.detector import ProjectDetection
@@ -37,6 +39,23 @@ def _setup_windows_utf8() -> None:
 _setup_windows_utf8()
 
 
+@lru_cache(maxsize=8)
+def _console_for(rich_theme: RichTheme) -> Console:
+    """Get the console for a Rich theme, creating it on first use.
+
+    Console construction probes the terminal (color system, size, legacy
+    Windows console), so renderers using the same theme share one console.
+    Output still goes to whatever sys.stdout is at print time.
+
+    Args:
+        rich_theme: Rich theme the console renders with
+
+    Returns:
+        Console shared by every renderer using this theme
+    """
+    return Console(theme=rich_theme)
+
+
 class CommandSpinnerContext:
     """Context for managing command spinner state."""
 
@@ -65,6 +84,14 @@ class CommandSpinnerContext:
 class UIRenderer:
     """Renders UI elements for WatchFlow."""
 
+    __slots__ = (
+        "_layout_mode",
+        "_layout_width",
+        "console",
+        "terminal_width",
+        "theme",
+    )
+
     def __init__(self, theme_name: str = "pro"):
         """Initialize renderer.
 
@@ -72,23 +99,32 @@ class UIRenderer:
             theme_name: Name of theme to use
         """
         self.theme = Themes.get_theme(theme_name)
-        self.console = Console(theme=self.theme.rich_theme)
+        self.console = _console_for(self.theme.rich_theme)
         self.terminal_width = shutil.get_terminal_size().columns
+        self._layout_width = -1
+        self._layout_mode = "full"
 
     def _get_layout_mode(self) -> str:
         """Determine layout mode based on terminal width.
 
+        The mode is cached and only recomputed when terminal_width changes.
+
         Returns:
             Layout mode: 'full', 'compact', or 'minimal'
         """
-        if self.terminal_width >= 80:
-            return "full"
-        elif self.terminal_width >= 60:
-            return "compact"
-        else:
-            return "minimal"
+        width = self.terminal_width
+        if width != self._layout_width:
+            self._layout_width = width
+            if width >= 80:
+                self._layout_mode = "full"
+            elif width >= 60:
+                self._layout_mode = "compact"
+            else:
+                self._layout_mode = "minimal"
+        return self._layout_mode
 
-    def _truncate(self, text: str, max_length: int) -> str:
+    @staticmethod
+    def _truncate(text: str, max_length: int) -> str:
         """Truncate text intelligently.
 
         Args:
@@ -170,21 +206,26 @@ class UIRenderer:
         icon = Icons.get("gear", self.theme)
         self.console.print(f"\n{icon} Required Tools:\n", style="info")
 
+        check = Icons.get("check", self.theme)
+        cross = Icons.get("cross", self.theme)
+        arrow = Icons.get("arrow", self.theme)
+
+        # Collect every row and print them in one call; rows are highlighted
+        # here since print() doesn't highlight Text the way it does strings
+        highlight = self.console.highlighter
+        lines: list[Text] = []
         for tool in tools:
             if tool.available:
-                status_icon = Icons.get("check", self.theme)
                 version = f" ({tool.version})" if tool.version else ""
-                self.console.print(
-                    f"  {status_icon} {tool.name}{version}", style="success"
-                )
+                row = Text(f"  {check} {tool.name}{version}", style="success")
+                lines.append(highlight(row))
             else:
-                status_icon = Icons.get("cross", self.theme)
-                self.console.print(f"  {status_icon} {tool.name}", style="error")
+                lines.append(highlight(Text(f"  {cross} {tool.name}", style="error")))
                 if tool.install_hint:
-                    self.console.print(
-                        f"     {Icons.get('arrow', self.theme)} {tool.install_hint}",
-                        style="dim",
-                    )
+                    hint = Text(f"     {arrow} {tool.install_hint}", style="dim")
+                    lines.append(highlight(hint))
+
+        self.console.print(Text("\n").join(lines))
 
     def print_config_created(self, config_path: str) -> None:
         """Print configuration created message.
@@ -2,11 +2,16 @@
 
 import os
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import cache, cached_property
+from typing import ClassVar
 
-from rich.console import Console
+from rich import get_console
 from rich.theme import Theme as RichTheme
 
+# Environment variables set by common CI/CD providers
+_CI_VARS = frozenset({"CI", "GITHUB_ACTIONS", "GITLAB_CI", "CIRCLECI", "TRAVIS"})
+
 
 def _can_display_emoji() -> bool:
     """Check if the terminal can display emoji.
@@ -14,22 +19,21 @@ def _can_display_emoji() -> bool:
     Returns:
         True if emoji can be displayed, False otherwise
     """
+    env = os.environ
+
     # On Windows, check if we're using Windows Terminal or a modern console
     if sys.platform == "win32":
         # Windows Terminal sets WT_SESSION
-        if os.getenv("WT_SESSION"):
+        if env.get("WT_SESSION"):
             return True
         # VS Code terminal
-        if os.getenv("TERM_PROGRAM") == "vscode":
-            return True
-        # ConEmu/Cmder
-        if os.getenv("ConEmuANSI") == "ON":
+        if env.get("TERM_PROGRAM") == "vscode":
             return True
-        # Default Windows console doesn't support emoji well
-        return False
+        # ConEmu/Cmder; the default Windows console doesn't support emoji well
+        return env.get("ConEmuANSI") == "ON"
 
     # On Unix-like systems, check TERM
-    term = os.getenv("TERM", "")
+    term = env.get("TERM", "")
     if "xterm" in term or "screen" in term or "tmux" in term or "256color" in term:
         return True
 
@@ -40,16 +44,98 @@ def _can_display_emoji() -> bool:
     return True
 
 
-@dataclass
+def _intern_styles(styles: dict[str, str]) -> dict[str, str]:
+    """Intern style definitions so repeated strings share one object.
+
+    Args:
+        styles: Mapping of style name to Rich style definition
+
+    Returns:
+        Mapping with interned style definitions
+    """
+    return {name: sys.intern(style) for name, style in styles.items()}
+
+
+_PRO_STYLES = _intern_styles(
+    {
+        "success": "bold green",
+        "error": "bold red",
+        "warning": "bold yellow",
+        "info": "bold blue",
+        "debug": "dim white",
+        "title": "bold cyan",
+        "subtitle": "italic cyan",
+        "command": "bold magenta",
+        "path": "bold blue",
+        "timestamp": "dim cyan",
+        "watcher": "bold yellow",
+    }
+)
+
+_MINIMAL_STYLES = _intern_styles(
+    {
+        "success": "white",
+        "error": "white",
+        "warning": "white",
+        "info": "white",
+        "debug": "white",
+        "title": "bold white",
+        "subtitle": "white",
+        "command": "white",
+        "path": "white",
+        "timestamp": "white",
+        "watcher": "white",
+    }
+)
+
+_NEON_STYLES = _intern_styles(
+    {
+        "success": "bold bright_green",
+        "error": "bold bright_red",
+        "warning": "bold bright_yellow",
+        "info": "bold bright_cyan",
+        "debug": "dim bright_white",
+        "title": "bold bright_magenta",
+        "subtitle": "italic bright_magenta",
+        "command": "bold bright_cyan",
+        "path": "bold bright_blue",
+        "timestamp": "bright_white",
+        "watcher": "bold bright_yellow",
+    }
+)
+
+
+@cache
+def _build_rich_theme(styles: tuple[tuple[str, str], ...]) -> RichTheme:
+    """Build a Rich theme, sharing one instance per distinct style table.
+
+    Args:
+        styles: Style name/definition pairs
+
+    Returns:
+        Rich theme with the parsed styles
+    """
+    return RichTheme(dict(styles))
+
+
+@dataclass(frozen=True)
 class ThemeConfig:
-    """Theme configuration."""
+    """Theme configuration.
+
+    Instances are immutable so the built-in themes can be shared freely.
+    """
 
     name: str
     use_emoji: bool
     use_icons: bool
     use_panels: bool
     use_colors: bool
-    rich_theme: RichTheme
+    styles: dict[str, str]
+
+    @cached_property
+    def rich_theme(self) -> RichTheme:
+        """Rich theme for this configuration, built on first access."""
+        return _build_rich_theme(tuple(self.styles.items()))
 
 
 class Themes:
@@ -61,21 +147,7 @@ class Themes:
         use_icons=True,
         use_panels=True,
         use_colors=True,
-        rich_theme=RichTheme(
-            {
-                "success": "bold green",
-                "error": "bold red",
-                "warning": "bold yellow",
-                "info": "bold blue",
-                "debug": "dim white",
-                "title": "bold cyan",
-                "subtitle": "italic cyan",
-                "command": "bold magenta",
-                "path": "bold blue",
-                "timestamp": "dim cyan",
-                "watcher": "bold yellow",
-            }
-        ),
+        styles=_PRO_STYLES,
     )
 
     MINIMAL = ThemeConfig(
@@ -84,21 +156,7 @@ class Themes:
         use_icons=False,
         use_panels=False,
         use_colors=False,
-        rich_theme=RichTheme(
-            {
-                "success": "white",
-                "error": "white",
-                "warning": "white",
-                "info": "white",
-                "debug": "white",
-                "title": "bold white",
-                "subtitle": "white",
-                "command": "white",
-                "path": "white",
-                "timestamp": "white",
-                "watcher": "white",
-            }
-        ),
+        styles=_MINIMAL_STYLES,
     )
 
     NEON = ThemeConfig(
@@ -107,23 +165,20 @@ class Themes:
         use_icons=True,
         use_panels=True,
         use_colors=True,
-        rich_theme=RichTheme(
-            {
-                "success": "bold bright_green",
-                "error": "bold bright_red",
-                "warning": "bold bright_yellow",
-                "info": "bold bright_cyan",
-                "debug": "dim bright_white",
-                "title": "bold bright_magenta",
-                "subtitle": "italic bright_magenta",
-                "command": "bold bright_cyan",
-                "path": "bold bright_blue",
-                "timestamp": "bright_white",
-                "watcher": "bold bright_yellow",
-            }
-        ),
+        styles=_NEON_STYLES,
     )
 
+    # Built-in themes by name, plus emoji-free variants of each for
+    # terminals that can't display emoji
+    _BY_NAME: ClassVar[dict[str, ThemeConfig]] = {
+        "pro": PRO,
+        "minimal": MINIMAL,
+        "neon": NEON,
+    }
+    _WITHOUT_EMOJI: ClassVar[dict[str, ThemeConfig]] = {
+        name: replace(theme, use_emoji=False) for name, theme in _BY_NAME.items()
+    }
+
     @classmethod
     def get_theme(cls, theme_name: str) -> ThemeConfig:
         """Get theme by name.
@@ -137,25 +192,12 @@ class Themes:
         if theme_name == "auto":
             return cls._detect_theme()
 
-        themes = {
-            "pro": cls.PRO,
-            "minimal": cls.MINIMAL,
-            "neon": cls.NEON,
-        }
-
-        theme = themes.get(theme_name.lower(), cls.PRO)
+        theme = cls._BY_NAME.get(theme_name.lower(), cls.PRO)
 
         # If the selected theme uses emoji but terminal doesn't support it,
         # return a version with emoji disabled
         if theme.use_emoji and not _can_display_emoji():
-            return ThemeConfig(
-                name=theme.name,
-                use_emoji=False,
-                use_icons=theme.use_icons,
-                use_panels=theme.use_panels,
-                use_colors=theme.use_colors,
-                rich_theme=theme.rich_theme,
-            )
+            return cls._WITHOUT_EMOJI[theme.name]
 
         return theme
 
@@ -167,16 +209,16 @@ class Themes:
             ThemeConfig based on detection
         """
         # Check if running in CI/CD
-        ci_vars = ["CI", "GITHUB_ACTIONS", "GITLAB_CI", "CIRCLECI", "TRAVIS"]
-        if any(os.getenv(var) for var in ci_vars):
+        env = os.environ
+        if any(env.get(var) for var in _CI_VARS):
             return cls.MINIMAL
 
         # Check if output is redirected
         if not sys.stdout.isatty():
             return cls.MINIMAL
 
-        # Check terminal capabilities
-        console = Console()
+        # Check terminal capabilities on Rich's process-wide console
+        console = get_console()
 
         # No color support
         if not console.color_system:
@@ -196,21 +238,57 @@ class Themes:
         Returns:
             ThemeConfig with colors but no emoji
         """
-        return ThemeConfig(
-            name="pro",
-            use_emoji=False,  # Disable emoji for compatibility
-            use_icons=True,
-            use_panels=True,
-            use_colors=True,
-            rich_theme=cls.PRO.rich_theme,
-        )
+        return cls._WITHOUT_EMOJI["pro"]
 
 
 class Icons:
     """Icon definitions for different themes."""
 
-    @staticmethod
-    def get(name: str, theme: ThemeConfig) -> str:
+    EMOJI: ClassVar[dict[str, str]] = {
+        "watch": "👁️",
+        "success": "✅",
+        "error": "❌",
+        "warning": "⚠️",
+        "info": "ℹ️",
+        "rocket": "🚀",
+        "gear": "⚙️",
+        "folder": "📁",
+        "file": "📄",
+        "code": "💻",
+        "time": "⏱️",
+        "skip": "⏭️",
+        "play": "▶️",
+        "stop": "⏹️",
+        "check": "✓",
+        "cross": "✗",
+        "arrow": "→",
+        "bullet": "•",
+    }
+
+    # ASCII fallback
+    ASCII: ClassVar[dict[str, str]] = {
+        "watch": "[W]",
+        "success": "[OK]",
+        "error": "[ERR]",
+        "warning": "[WARN]",
+        "info": "[INFO]",
+        "rocket": "[*]",
+        "gear": "[*]",
+        "folder": "[D]",
+        "file": "[F]",
+        "code": "[C]",
+        "time": "[T]",
+        "skip": "[SKIP]",
+        "play": "[>]",
+        "stop": "[#]",
+        "check": "[+]",
+        "cross": "[-]",
+        "arrow": "->",
+        "bullet": "*",
+    }
+
+    @classmethod
+    def get(cls, name: str, theme: ThemeConfig) -> str:
         """Get icon for theme.
 
         Args:
@@ -221,47 +299,5 @@ class Icons:
             Icon string or ASCII fallback
         """
         if theme.use_emoji:
-            emoji_icons = {
-                "watch": "👁️",
-                "success": "✅",
-                "error": "❌",
-                "warning": "⚠️",
-                "info": "ℹ️",
-                "rocket": "🚀",
-                "gear": "⚙️",
-                "folder": "📁",
-                "file": "📄",
-                "code": "💻",
-                "time": "⏱️",
-                "skip": "⏭️",
-                "play": "▶️",
-                "stop": "⏹️",
-                "check": "✓",
-                "cross": "✗",
-                "arrow": "→",
-                "bullet": "•",
-            }
-            return emoji_icons.get(name, "•")
-
-        # ASCII fallback
-        ascii_icons = {
-            "watch": "[W]",
-            "success": "[OK]",
-            "error": "[ERR]",
-            "warning": "[WARN]",
-            "info": "[INFO]",
-            "rocket": "[*]",
-            "gear": "[*]",
-            "folder": "[D]",
-            "file": "[F]",
-            "code": "[C]",
-            "time": "[T]",
-            "skip": "[SKIP]",
-            "play": "[>]",
-            "stop": "[#]",
-            "check": "[+]",
-            "cross": "[-]",
-            "arrow": "->",
-            "bullet": "*",
-        }
-        return ascii_icons.get(name, "*")
+            return cls.EMOJI.get(name, "•")
+        return cls.ASCII.get(name, "*")
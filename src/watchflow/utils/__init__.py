@@ -1,6 +1,16 @@
 """Utilities package."""
 
 from watchflow.utils.logger import get_logger, setup_logging
-from watchflow.utils.templates import CONFIG_TEMPLATES, TemplateEngine
+from watchflow.utils.templates import (
+    CONFIG_TEMPLATES,
+    TemplateEngine,
+    render_config,
+)
 
-__all__ = ["CONFIG_TEMPLATES", "TemplateEngine", "get_logger", "setup_logging"]
+__all__ = [
+    "CONFIG_TEMPLATES",
+    "TemplateEngine",
+    "get_logger",
+    "render_config",
+    "setup_logging",
+]
@@ -1,15 +1,48 @@
 """Template variable substitution."""
 
 import re
-from datetime import datetime
+import time
+from functools import lru_cache
 from typing import Any
 
 
+@lru_cache(maxsize=1)
+def _format_second(second: int) -> str:
+    """Format the whole-second part of a local ISO 8601 timestamp.
+
+    Events arrive in bursts, so the last formatted second is kept and only
+    the microseconds are formatted per call.
+
+    Args:
+        second: Seconds since the epoch
+
+    Returns:
+        Timestamp such as 2024-01-31T12:34:56
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+
+
 class TemplateEngine:
     """Handles template variable substitution in commands."""
 
     VARIABLE_PATTERN = re.compile(r"\{\{(\w+)\}\}")
 
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _parse(cls, template: str) -> tuple[str, ...]:
+        """Split a template into literal and placeholder parts, memoized.
+
+        Command templates come from configuration and are substituted on
+        every file event, so each distinct template is only scanned once.
+
+        Args:
+            template: Template string with {{variable}} placeholders
+
+        Returns:
+            Alternating (literal, name, literal, ..., literal) parts
+        """
+        return tuple(cls.VARIABLE_PATTERN.split(template))
+
     @classmethod
     def substitute(
         cls,
@@ -25,13 +58,44 @@ class TemplateEngine:
         Returns:
             String with variables substituted
         """
+        # Most commands contain no placeholders at all
+        if "{{" not in template:
+            return template
+
+        # Whole-argument placeholders such as "{{path}}" need no regex; the
+        # "_" swap makes isalnum() accept exactly the \w+ names the pattern does
+        if template.startswith("{{") and template.endswith("}}"):
+            name = template[2:-2]
+            if name in variables and name.replace("_", "a").isalnum():
+                return str(variables[name])
+
+        # Parts alternate [literal, name, literal, name, ..., literal]
+        parts = cls._parse(template)
+        if len(parts) == 1:
+            return template
+        return cls._join(parts, variables)
 
-        def replacer(match: re.Match[str]) -> str:
-            var_name = match.group(1)
-            value = variables.get(var_name, match.group(0))
-            return str(value)
+    @staticmethod
+    def _join(parts: tuple[str, ...], variables: dict[str, Any]) -> str:
+        """Join parsed template parts, filling in known variables.
 
-        return cls.VARIABLE_PATTERN.sub(replacer, template)
+        Args:
+            parts: Alternating (literal, name, ..., literal) parts from _parse
+            variables: Dictionary of variable values
+
+        Returns:
+            String with known variables substituted and unknown placeholders
+            left as-is
+        """
+        result = [parts[0]]
+        for i in range(1, len(parts), 2):
+            var_name = parts[i]
+            if var_name in variables:
+                result.append(str(variables[var_name]))
+            else:
+                result.append("{{" + var_name + "}}")
+            result.append(parts[i + 1])
+        return "".join(result)
 
     @classmethod
     def substitute_list(
@@ -48,7 +112,10 @@ class TemplateEngine:
         Returns:
             List with variables substituted
         """
-        return [cls.substitute(template, variables) for template in templates]
+        return [
+            cls.substitute(template, variables) if "{{" in template else template
+            for template in templates
+        ]
 
     @staticmethod
     def create_context(
@@ -68,11 +135,15 @@ class TemplateEngine:
         Returns:
             Dictionary of template variables
         """
+        now = time.time()
+        second = int(now)
         return {
             "path": path,
             "paths": " ".join(paths),
             "event": event,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": (
+                f"{_format_second(second)}.{int((now - second) * 1_000_000):06d}"
+            ),
             "watcher": watcher_name,
         }
 
@@ -314,3 +385,26 @@ watchers:
         retries: 0
 """,
 }
+
+
+# CONFIG_TEMPLATES pre-split into literal and placeholder parts
+_COMPILED_TEMPLATES = {
+    language: TemplateEngine._parse(template)
+    for language, template in CONFIG_TEMPLATES.items()
+}
+
+
+def render_config(language: str, variables: dict[str, Any]) -> str:
+    """Render a config template without scanning it again.
+
+    Args:
+        language: Key of the template in CONFIG_TEMPLATES
+        variables: Dictionary of variable values
+
+    Returns:
+        Configuration content with variables substituted
+
+    Raises:
+        KeyError: If there is no template for the language
+    """
+    return TemplateEngine._join(_COMPILED_TEMPLATES[language], variables)
@@ -1,10 +1,23 @@
 """Pytest configuration and fixtures."""
 
+import asyncio
+import contextlib
+import os
+import sys
 import tempfile
 from pathlib import Path
 
 import pytest
 
+from watchflow.config import Command, Watcher
+from watchflow.detection import ProjectDetector
+
+# uvloop is optional and POSIX-only; use it for the shared loop when present
+uvloop = None
+if sys.platform != "win32":
+    with contextlib.suppress(ImportError):
+        import uvloop
+
 
 @pytest.fixture
 def tmp_path():
@@ -13,6 +26,84 @@ def tmp_path():
         yield Path(tmpdir)
 
 
+@pytest.fixture(scope="session")
+def session_loop():
+    """Provide one event loop shared by every async test in the session.
+
+    Tests drive coroutines with session_loop.run_until_complete() instead of
+    asyncio.run(), which creates and tears down a new loop on each call.
+    The loop is backed by uvloop when it is installed.
+    """
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    yield loop
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def always_exists_dir():
+    """Provide a directory that always exists, for path-existence validators.
+
+    Tests that only need a watcher path to pass validation use this instead
+    of creating and removing a temporary directory.
+    """
+    return Path(os.getcwd())
+
+
+@pytest.fixture(scope="session")
+def echo_cmd():
+    """Provide a pre-built echo Command shared across tests."""
+    return Command.model_construct(name="cmd", cmd=["echo"])
+
+
+@pytest.fixture(scope="session")
+def minimal_watcher(always_exists_dir, echo_cmd):
+    """Provide a pre-built minimal Watcher shared across tests."""
+    return Watcher.model_construct(
+        name="test", paths=[str(always_exists_dir)], commands=[echo_cmd]
+    )
+
+
+@pytest.fixture(scope="session")
+def project_skeleton(tmp_path_factory):
+    """Provide shared project directories containing empty marker files.
+
+    Each distinct set of markers is created once per session and handed to
+    every test asking for the same layout. Tests must treat these
+    directories as read-only.
+    """
+    skeletons: dict[frozenset[str], Path] = {}
+
+    def make(*names: str) -> Path:
+        key = frozenset(names)
+        if key not in skeletons:
+            root = tmp_path_factory.mktemp("skeleton")
+            for name in names:
+                (root / name).touch()
+            skeletons[key] = root
+        return skeletons[key]
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def detect(project_skeleton):
+    """Provide shared ProjectDetectors for project skeleton layouts.
+
+    Tests asking for the same markers get the same detector, whose cached
+    directory listing is reused by every detect_all/detect_primary call.
+    """
+    detectors: dict[Path, ProjectDetector] = {}
+
+    def make(*names: str) -> ProjectDetector:
+        root = project_skeleton(*names)
+        if root not in detectors:
+            detectors[root] = ProjectDetector(root)
+        return detectors[root]
+
+    return make
+
+
 @pytest.fixture
 def sample_config_dict(tmp_path):
     """Provide a sample configuration dictionary."""
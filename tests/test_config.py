@@ -1,6 +1,9 @@
 """Tests for configuration models and validation."""
 
+import json
+import os
 from pathlib import Path
+from typing import Any
 
 import pytest
 from pydantic import ValidationError
@@ -22,15 +25,33 @@ from watchflow.exceptions import (
 )
 
 
+def make_command(**kwargs: Any) -> Command:
+    """Build a Command from trusted test data without running validation."""
+    return Command.model_construct(**{"name": "cmd", "cmd": ["echo"], **kwargs})
+
+
+def make_watcher(**kwargs: Any) -> Watcher:
+    """Build a Watcher from trusted test data without running validation."""
+    defaults: dict[str, Any] = {"name": "test", "commands": [make_command()]}
+    return Watcher.model_construct(**{**defaults, **kwargs})
+
+
+def make_global_config(**kwargs: Any) -> GlobalConfig:
+    """Build a GlobalConfig from trusted test data without running validation."""
+    return GlobalConfig.model_construct(**kwargs)
+
+
+def make_config(**kwargs: Any) -> Config:
+    """Build a Config from trusted test data without running validation."""
+    return Config.model_construct(**{"version": 1, **kwargs})
+
+
 class TestCommand:
     """Tests for Command model."""
 
     def test_valid_command(self):
         """Test valid command creation."""
-        cmd = Command(
-            name="test-command",
-            cmd=["echo", "hello"],
-        )
+        cmd = make_command(name="test-command", cmd=["echo", "hello"])
         assert cmd.name == "test-command"
         assert cmd.cmd == ["echo", "hello"]
         assert cmd.timeout is None
@@ -38,7 +59,7 @@ class TestCommand:
 
     def test_command_with_all_fields(self):
         """Test command with all optional fields."""
-        cmd = Command(
+        cmd = make_command(
             name="complex-command",
             cmd=["python", "script.py"],
             timeout=60,
@@ -52,44 +73,29 @@ class TestCommand:
         assert cmd.retries == 3
         assert cmd.retry_strategy == RetryStrategy.EXPONENTIAL
 
-    def test_empty_command_fails(self):
-        """Test that empty command fails validation."""
-        with pytest.raises(ValidationError):
-            Command(name="test", cmd=[])
-
-    def test_invalid_retries_fails(self):
-        """Test that invalid retry count fails."""
-        with pytest.raises(ValidationError):
-            Command(name="test", cmd=["echo"], retries=-1)
-
-        with pytest.raises(ValidationError):
-            Command(name="test", cmd=["echo"], retries=11)
-
 
 class TestWatcher:
     """Tests for Watcher model."""
 
-    def test_valid_watcher(self, tmp_path):
+    def test_valid_watcher(self, always_exists_dir, echo_cmd):
         """Test valid watcher creation."""
-        watcher = Watcher(
-            name="test-watcher",
-            paths=[str(tmp_path)],
-            commands=[Command(name="cmd", cmd=["echo"])],
+        watcher = make_watcher(
+            name="test-watcher", paths=[str(always_exists_dir)], commands=[echo_cmd]
         )
         assert watcher.name == "test-watcher"
         assert len(watcher.commands) == 1
         assert watcher.recursive is True
         assert watcher.debounce == 100
 
-    def test_watcher_with_patterns(self, tmp_path):
+    def test_watcher_with_patterns(self, always_exists_dir, echo_cmd):
         """Test watcher with patterns."""
-        watcher = Watcher(
+        watcher = make_watcher(
             name="test-watcher",
-            paths=[str(tmp_path)],
+            paths=[str(always_exists_dir)],
+            commands=[echo_cmd],
             patterns=["*.py", "*.js"],
             ignore_patterns=["*.pyc", "__pycache__"],
             debounce=500,
-            commands=[Command(name="cmd", cmd=["echo"])],
             parallel=True,
         )
         assert watcher.patterns == ["*.py", "*.js"]
@@ -97,33 +103,6 @@ class TestWatcher:
         assert watcher.debounce == 500
         assert watcher.parallel is True
 
-    def test_empty_paths_fails(self):
-        """Test that empty paths fails validation."""
-        with pytest.raises(ValidationError):
-            Watcher(
-                name="test",
-                paths=[],
-                commands=[Command(name="cmd", cmd=["echo"])],
-            )
-
-    def test_nonexistent_path_fails(self):
-        """Test that nonexistent path fails validation."""
-        with pytest.raises(ValidationError):
-            Watcher(
-                name="test",
-                paths=["/nonexistent/path/12345"],
-                commands=[Command(name="cmd", cmd=["echo"])],
-            )
-
-    def test_empty_commands_fails(self, tmp_path):
-        """Test that empty commands fails validation."""
-        with pytest.raises(ValidationError):
-            Watcher(
-                name="test",
-                paths=[str(tmp_path)],
-                commands=[],
-            )
-
 
 class TestGlobalConfig:
     """Tests for GlobalConfig model."""
@@ -146,53 +125,29 @@ class TestGlobalConfig:
         assert config.fail_fast is True
         assert config.max_parallel_commands == 8
 
-    def test_invalid_max_parallel_fails(self):
-        """Test that invalid max_parallel fails."""
-        with pytest.raises(ValidationError):
-            GlobalConfig(max_parallel_commands=0)
-
-        with pytest.raises(ValidationError):
-            GlobalConfig(max_parallel_commands=33)
-
 
 class TestConfig:
     """Tests for Config model."""
 
-    def test_minimal_config(self, tmp_path):
+    def test_minimal_config(self, minimal_watcher):
         """Test minimal valid configuration."""
-        config = Config(
-            version=1,
-            watchers=[
-                Watcher(
-                    name="test",
-                    paths=[str(tmp_path)],
-                    commands=[Command(name="cmd", cmd=["echo"])],
-                )
-            ],
-        )
+        config = make_config(watchers=[minimal_watcher])
         assert config.version == 1
         assert len(config.watchers) == 1
 
-    def test_full_config(self, tmp_path):
+    def test_full_config(self, minimal_watcher):
         """Test full configuration with all fields."""
-        config = Config(
-            version=1,
+        config = make_config(
             project_name="test-project",
             project_type="python",
-            global_config=GlobalConfig(theme=UITheme.MINIMAL),
-            watchers=[
-                Watcher(
-                    name="test",
-                    paths=[str(tmp_path)],
-                    commands=[Command(name="cmd", cmd=["echo"])],
-                )
-            ],
+            global_config=make_global_config(theme=UITheme.MINIMAL),
+            watchers=[minimal_watcher],
         )
         assert config.project_name == "test-project"
         assert config.project_type == "python"
         assert config.global_config.theme == UITheme.MINIMAL
 
-    def test_global_alias(self, tmp_path):
+    def test_global_alias(self, always_exists_dir):
         """Test that 'global' alias works."""
         data = {
             "version": 1,
@@ -200,7 +155,7 @@ class TestConfig:
             "watchers": [
                 {
                     "name": "test",
-                    "paths": [str(tmp_path)],
+                    "paths": [str(always_exists_dir)],
                     "commands": [{"name": "cmd", "cmd": ["echo"]}],
                 }
             ],
@@ -208,10 +163,46 @@ class TestConfig:
         config = Config(**data)
         assert config.global_config.theme == UITheme.NEON
 
-    def test_empty_watchers_fails(self):
-        """Test that empty watchers fails validation."""
+
+class TestValidationErrors:
+    """Tests for model validation failures."""
+
+    @pytest.mark.parametrize(
+        "model_cls,kwargs",
+        [
+            (Command, {"name": "test", "cmd": []}),
+            (Command, {"name": "test", "cmd": ["echo"], "retries": -1}),
+            (Command, {"name": "test", "cmd": ["echo"], "retries": 11}),
+            (Watcher, {"name": "test", "paths": [], "commands": [make_command()]}),
+            (
+                Watcher,
+                {
+                    "name": "test",
+                    "paths": ["/nonexistent/path/12345"],
+                    "commands": [make_command()],
+                },
+            ),
+            (Watcher, {"name": "test", "paths": ["."], "commands": []}),
+            (GlobalConfig, {"max_parallel_commands": 0}),
+            (GlobalConfig, {"max_parallel_commands": 33}),
+            (Config, {"version": 1, "watchers": []}),
+        ],
+        ids=[
+            "empty-command",
+            "negative-retries",
+            "too-many-retries",
+            "empty-paths",
+            "nonexistent-path",
+            "empty-commands",
+            "zero-max-parallel",
+            "too-many-max-parallel",
+            "empty-watchers",
+        ],
+    )
+    def test_invalid_model_fails(self, model_cls, kwargs):
+        """Test that invalid model data fails validation."""
         with pytest.raises(ValidationError):
-            Config(version=1, watchers=[])
+            model_cls(**kwargs)
 
 
 class TestConfigValidator:
@@ -220,6 +211,29 @@ class TestConfigValidator:
     def test_load_valid_config(self, tmp_path):
         """Test loading valid configuration."""
         config_path = tmp_path / "config.yaml"
+        # JSON is valid YAML and exercises the direct JSON validation path
+        config_data = {
+            "version": 1,
+            "project_name": "test",
+            "global": {"theme": "neon"},
+            "watchers": [
+                {
+                    "name": "test-watcher",
+                    "paths": [str(tmp_path)],
+                    "commands": [{"name": "test-cmd", "cmd": ["echo", "hello"]}],
+                }
+            ],
+        }
+        config_path.write_text(json.dumps(config_data))
+
+        config = ConfigValidator.load_config(config_path)
+        assert config.project_name == "test"
+        assert config.global_config.theme == UITheme.NEON
+        assert len(config.watchers) == 1
+
+    def test_load_yaml_config(self, tmp_path):
+        """Test loading a block-style YAML configuration."""
+        config_path = tmp_path / "config.yaml"
         config_content = f"""
 version: 1
 project_name: test
@@ -237,6 +251,25 @@ watchers:
         assert config.project_name == "test"
         assert len(config.watchers) == 1
 
+    def test_load_config_bytes_yaml_flow_mapping(self, always_exists_dir):
+        """Test that non-strict JSON flow mappings fall back to YAML."""
+        content = (
+            f"{{version: 1, watchers: [{{name: w, paths: ['{always_exists_dir}'], "
+            "commands: [{name: c, cmd: [echo]}]}]}"
+        ).encode()
+
+        config = ConfigValidator.load_config_bytes(content)
+        assert config.watchers[0].name == "w"
+
+    def test_load_config_bytes_invalid_json_config(self):
+        """Test that JSON content failing validation raises a config error."""
+        content = json.dumps({"version": 1, "watchers": []}).encode()
+
+        with pytest.raises(ConfigValidationError) as exc_info:
+            ConfigValidator.load_config_bytes(content, path="inline.json")
+        assert exc_info.value.path == "inline.json"
+        assert any("watchers" in error for error in exc_info.value.errors)
+
     def test_load_nonexistent_file_fails(self):
         """Test loading nonexistent file fails."""
         with pytest.raises(ConfigNotFoundError) as exc_info:
@@ -260,37 +293,34 @@ watchers:
             ConfigValidator.load_config(config_path)
         assert "empty" in exc_info.value.errors[0].lower()
 
-    def test_save_config(self, tmp_path):
+    @pytest.mark.parametrize("content", [b"{}", b" { }\n", b"null", b"   "])
+    def test_load_config_bytes_empty_document_fails(self, content):
+        """Test that empty JSON and YAML documents give the same error."""
+        with pytest.raises(ConfigValidationError) as exc_info:
+            ConfigValidator.load_config_bytes(content, path="inline.json")
+        assert exc_info.value.errors == ["Configuration file is empty"]
+        assert exc_info.value.path == "inline.json"
+
+    def test_save_config(self, tmp_path, minimal_watcher):
         """Test saving configuration."""
-        config = Config(
-            version=1,
-            project_name="test",
-            watchers=[
-                Watcher(
-                    name="test",
-                    paths=[str(tmp_path)],
-                    commands=[Command(name="cmd", cmd=["echo"])],
-                )
-            ],
-        )
+        config = make_config(project_name="test", watchers=[minimal_watcher])
 
         config_path = tmp_path / "saved.yaml"
         ConfigValidator.save_config(config, config_path)
 
-        assert config_path.exists()
+        content = config_path.read_text()
+        assert "project_name: test" in content
+        assert "global:" in content
+        assert "global_config" not in content
 
-        # Load it back
-        loaded = ConfigValidator.load_config(config_path)
-        assert loaded.project_name == "test"
-
-    def test_validate_config_dict(self, tmp_path):
+    def test_validate_config_dict(self, always_exists_dir):
         """Test validating configuration dictionary."""
         data = {
             "version": 1,
             "watchers": [
                 {
                     "name": "test",
-                    "paths": [str(tmp_path)],
+                    "paths": [str(always_exists_dir)],
                     "commands": [{"name": "cmd", "cmd": ["echo"]}],
                 }
             ],
@@ -300,6 +330,54 @@ watchers:
         assert is_valid
         assert len(errors) == 0
 
+    def test_validate_config_dict_does_not_mutate_input(self, always_exists_dir):
+        """Test that validation leaves the caller's dictionary unchanged."""
+        data = {
+            "version": 1,
+            "global": {"theme": "neon"},
+            "watchers": [
+                {
+                    "name": "test",
+                    "paths": [str(always_exists_dir)],
+                    "commands": [{"name": "cmd", "cmd": ["echo"]}],
+                }
+            ],
+        }
+
+        is_valid, _ = ConfigValidator.validate_config_dict(data)
+        assert is_valid
+        assert "global" in data
+        assert "global_config" not in data
+
+    def test_validate_config_dict_returns_fresh_errors(self):
+        """Test that repeated validation returns a fresh error list."""
+        data = {"version": 1, "watchers": []}
+
+        _, errors = ConfigValidator.validate_config_dict(data)
+        errors.clear()
+        is_valid, errors_again = ConfigValidator.validate_config_dict(data)
+        assert not is_valid
+        assert len(errors_again) > 0
+
+    def test_validate_config_dict_rechecks_removed_path(self, tmp_path):
+        """Test that revalidating notices a watched path disappearing."""
+        watch_dir = tmp_path / "src"
+        watch_dir.mkdir()
+        data = {
+            "version": 1,
+            "watchers": [
+                {
+                    "name": "test",
+                    "paths": [str(watch_dir)],
+                    "commands": [{"name": "cmd", "cmd": ["echo"]}],
+                }
+            ],
+        }
+
+        assert ConfigValidator.validate_config_dict(data)[0]
+        watch_dir.rmdir()
+        assert not ConfigValidator.validate_config_dict(data)[0]
+
     def test_validate_invalid_dict(self):
         """Test validating invalid configuration dictionary."""
         data = {
@@ -315,46 +393,60 @@ watchers:
 class TestEnvironmentVariableExpansion:
     """Tests for environment variable expansion in configuration."""
 
-    def test_expand_simple_env_var(self, monkeypatch):
-        """Test simple environment variable expansion."""
-        monkeypatch.setenv("TEST_VAR", "hello")
-        result = expand_env_vars("${TEST_VAR}")
-        assert result == "hello"
-
-    def test_expand_env_var_with_default(self, monkeypatch):
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def _env(cls):
+        """Set the variables used by this class once and restore afterwards."""
+        saved = os.environ.copy()
+        os.environ.update(
+            {
+                "TEST_VAR": "hello",
+                "EXISTING_VAR": "value",
+                "NAME": "world",
+                "FIRST": "1",
+                "SECOND": "2",
+                "CMD": "python",
+                "PROJECT": "myproject",
+                "HOST": "localhost",
+                "PORT": "8080",
+                "PROJECT_NAME": "env-test-project",
+            }
+        )
+        os.environ.pop("NONEXISTENT_VAR", None)
+        os.environ.pop("UNDEFINED_VAR", None)
+        yield
+        os.environ.clear()
+        os.environ.update(saved)
+
+    @pytest.mark.parametrize(
+        "template,expected",
+        [
+            ("${TEST_VAR}", "hello"),
+            ("hello ${NAME}!", "hello world!"),
+            ("${FIRST} and ${SECOND}", "1 and 2"),
+        ],
+    )
+    def test_expand_env_vars_in_string(self, template, expected):
+        """Test simple, embedded and multiple environment variable expansion."""
+        assert expand_env_vars(template) == expected
+
+    def test_expand_env_var_with_default(self):
         """Test environment variable with default value."""
         # When env var exists, use it
-        monkeypatch.setenv("EXISTING_VAR", "value")
         result = expand_env_vars("${EXISTING_VAR:-default}")
         assert result == "value"
 
         # When env var doesn't exist, use default
-        monkeypatch.delenv("NONEXISTENT_VAR", raising=False)
         result = expand_env_vars("${NONEXISTENT_VAR:-default_value}")
         assert result == "default_value"
 
-    def test_expand_env_var_in_string(self, monkeypatch):
-        """Test environment variable in middle of string."""
-        monkeypatch.setenv("NAME", "world")
-        result = expand_env_vars("hello ${NAME}!")
-        assert result == "hello world!"
-
-    def test_expand_multiple_env_vars(self, monkeypatch):
-        """Test multiple environment variables in same string."""
-        monkeypatch.setenv("FIRST", "1")
-        monkeypatch.setenv("SECOND", "2")
-        result = expand_env_vars("${FIRST} and ${SECOND}")
-        assert result == "1 and 2"
-
-    def test_expand_env_vars_in_list(self, monkeypatch):
+    def test_expand_env_vars_in_list(self):
         """Test environment variable expansion in lists."""
-        monkeypatch.setenv("CMD", "python")
         result = expand_env_vars(["${CMD}", "script.py"])
         assert result == ["python", "script.py"]
 
-    def test_expand_env_vars_in_dict(self, monkeypatch):
+    def test_expand_env_vars_in_dict(self):
         """Test environment variable expansion in dictionaries."""
-        monkeypatch.setenv("PROJECT", "myproject")
         data = {
             "name": "${PROJECT}",
             "version": 1,
@@ -363,10 +455,8 @@ class TestEnvironmentVariableExpansion:
         assert result["name"] == "myproject"
         assert result["version"] == 1
 
-    def test_expand_nested_structures(self, monkeypatch):
+    def test_expand_nested_structures(self):
         """Test environment variable expansion in nested structures."""
-        monkeypatch.setenv("HOST", "localhost")
-        monkeypatch.setenv("PORT", "8080")
         data = {
             "servers": [
                 {"host": "${HOST}", "port": "${PORT}"},
@@ -376,15 +466,31 @@ class TestEnvironmentVariableExpansion:
         assert result["servers"][0]["host"] == "localhost"
         assert result["servers"][0]["port"] == "8080"
 
-    def test_unexpanded_var_without_default(self, monkeypatch):
+    def test_expand_returns_unchanged_containers(self):
+        """Test that containers without variables are not copied."""
+        data = {"name": "plain", "items": ["a", "b"], "count": 3}
+        result = expand_env_vars(data)
+        assert result is data
+        assert result["items"] is data["items"]
+
+    def test_expand_deeply_nested_structure(self):
+        """Test expansion below the interpreter recursion limit depth."""
+        data: Any = "${HOST}"
+        for _ in range(5000):
+            data = [data]
+
+        result = expand_env_vars(data)
+        for _ in range(5000):
+            result = result[0]
+        assert result == "localhost"
+
+    def test_unexpanded_var_without_default(self):
         """Test that undefined vars without defaults stay as-is."""
-        monkeypatch.delenv("UNDEFINED_VAR", raising=False)
         result = expand_env_vars("${UNDEFINED_VAR}")
         assert result == "${UNDEFINED_VAR}"
 
-    def test_load_config_with_env_vars(self, tmp_path, monkeypatch):
+    def test_load_config_with_env_vars(self, tmp_path):
         """Test loading configuration with environment variables."""
-        monkeypatch.setenv("PROJECT_NAME", "env-test-project")
         config_path = tmp_path / "config.yaml"
         config_content = f"""
 version: 1
@@ -402,9 +508,8 @@ watchers:
         config = ConfigValidator.load_config(config_path)
         assert config.project_name == "env-test-project"
 
-    def test_load_config_without_env_expansion(self, tmp_path, monkeypatch):
+    def test_load_config_without_env_expansion(self, tmp_path):
         """Test loading configuration with env expansion disabled."""
-        monkeypatch.setenv("PROJECT_NAME", "should-not-expand")
         config_path = tmp_path / "config.yaml"
         config_content = f"""
 version: 1
@@ -1,7 +1,10 @@
 """Tests for command executor."""
 
 import asyncio
+import os
+import sys
 
+import pytest
 
 from tests.test_utils import (
     get_echo_command,
@@ -11,12 +14,13 @@ from tests.test_utils import (
 )
 from watchflow.config import Command, RetryStrategy
 from watchflow.core.executor import CommandExecutor
+from watchflow.exceptions import CommandExecutionError
 
 
 class TestCommandExecutor:
     """Tests for CommandExecutor."""
 
-    def test_execute_simple_command(self, tmp_path):
+    def test_execute_simple_command(self, tmp_path, session_loop):
         """Test executing a simple successful command."""
 
         async def run_test():
@@ -30,14 +34,14 @@ class TestCommandExecutor:
             )
             return result
 
-        result = asyncio.run(run_test())
+        result = session_loop.run_until_complete(run_test())
 
         assert result.success
         assert result.return_code == 0
         assert "hello" in result.stdout.lower()
         assert not result.skipped
 
-    def test_execute_failing_command(self, tmp_path):
+    def test_execute_failing_command(self, tmp_path, session_loop):
         """Test executing a failing command."""
 
         async def run_test():
@@ -51,13 +55,63 @@ class TestCommandExecutor:
             )
             return result
 
-        result = asyncio.run(run_test())
+        result = session_loop.run_until_complete(run_test())
 
         assert not result.success
         assert result.return_code != 0
         assert not result.skipped
 
-    def test_execute_with_timeout(self, tmp_path):
+    def test_execute_large_output(self, tmp_path, session_loop):
+        """Test that output larger than one stream buffer is captured whole."""
+
+        async def run_test():
+            executor = CommandExecutor()
+            command = Command(
+                name="large",
+                cmd=[sys.executable, "-c", "print('x' * 3_000_000, end='')"],
+            )
+
+            return await executor.execute_command(
+                command=command,
+                template_vars={},
+                project_root=tmp_path,
+            )
+
+        result = session_loop.run_until_complete(run_test())
+
+        assert result.success
+        assert len(result.stdout) == 3_000_000
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX descriptors")
+    def test_execute_does_not_leak_inheritable_fds(self, tmp_path, session_loop):
+        """Test that inheritable descriptors (e.g. inotify) stay out of commands."""
+        read_fd, write_fd = os.pipe()
+        os.set_inheritable(read_fd, True)
+
+        async def run_test():
+            executor = CommandExecutor()
+            command = Command(
+                name="fds",
+                cmd=[sys.executable, "-c", f"import os; os.fstat({read_fd})"],
+            )
+
+            return await executor.execute_command(
+                command=command,
+                template_vars={},
+                project_root=tmp_path,
+            )
+
+        try:
+            result = session_loop.run_until_complete(run_test())
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+        # fstat only succeeds in the child if the descriptor leaked
+        assert not result.success
+        assert "Bad file descriptor" in result.stderr
+
+    def test_execute_with_timeout(self, tmp_path, session_loop):
         """Test command execution with timeout."""
 
         async def run_test():
@@ -75,12 +129,45 @@ class TestCommandExecutor:
             )
             return result
 
-        result = asyncio.run(run_test())
+        result = session_loop.run_until_complete(run_test())
 
         assert not result.success
         assert "timed out" in result.stderr.lower()
 
-    def test_execute_with_working_dir(self, tmp_path):
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX sleep")
+    def test_cancelled_command_kills_process(self, tmp_path, session_loop, monkeypatch):
+        """Test that cancelling a running command kills and reaps its process."""
+        processes = []
+        create_subprocess_exec = asyncio.create_subprocess_exec
+
+        async def spy(*args, **kwargs):
+            process = await create_subprocess_exec(*args, **kwargs)
+            processes.append(process)
+            return process
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", spy)
+
+        async def run_test():
+            executor = CommandExecutor()
+            command = Command(name="sleep", cmd=get_sleep_command(30))
+            task = asyncio.create_task(
+                executor.execute_command(
+                    command=command,
+                    template_vars={},
+                    project_root=tmp_path,
+                )
+            )
+            while not processes:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        session_loop.run_until_complete(run_test())
+
+        assert processes[0].returncode is not None
+
+    def test_execute_with_working_dir(self, tmp_path, session_loop):
         """Test command execution with working directory."""
         subdir = tmp_path / "subdir"
         subdir.mkdir()
@@ -100,13 +187,13 @@ class TestCommandExecutor:
             )
             return result
 
-        result = asyncio.run(run_test())
+        result = session_loop.run_until_complete(run_test())
 
         assert result.success
         # Check that output contains the subdirectory path
         assert "subdir" in result.stdout
 
-    def test_execute_with_retries_success(self, tmp_path):
+    def test_execute_with_retries_success(self, tmp_path, session_loop):
         """Test command with retries that eventually succeeds."""
 
         async def run_test():
@@ -124,11 +211,11 @@ class TestCommandExecutor:
             )
             return result
 
-        result = asyncio.run(run_test())
+        result = session_loop.run_until_complete(run_test())
 
         assert result.success
 
-    def test_execute_with_template_vars(self, tmp_path):
+    def test_execute_with_template_vars(self, tmp_path, session_loop):
         """Test command with template variable substitution."""
 
         async def run_test():
@@ -145,12 +232,12 @@ class TestCommandExecutor:
             )
             return result
 
-        result = asyncio.run(run_test())
+        result = session_loop.run_until_complete(run_test())
 
         assert result.success
         assert "test.txt" in result.stdout
 
-    def test_execute_skip_until_exists(self, tmp_path):
+    def test_execute_skip_until_exists(self, tmp_path, session_loop):
         """Test skip_until_exists condition."""
 
         async def run_test():
@@ -168,12 +255,12 @@ class TestCommandExecutor:
             )
             return result
 
-        result = asyncio.run(run_test())
+        result = session_loop.run_until_complete(run_test())
 
         assert result.skipped
         assert "nonexistent.txt" in result.skip_reason
 
-    def test_execute_skip_until_exists_file_present(self, tmp_path):
+    def test_execute_skip_until_exists_file_present(self, tmp_path, session_loop):
         """Test skip_until_exists when file exists."""
         test_file = tmp_path / "exists.txt"
         test_file.touch()
@@ -193,12 +280,46 @@ class TestCommandExecutor:
             )
             return result
 
-        result = asyncio.run(run_test())
+        result = session_loop.run_until_complete(run_test())
 
         assert not result.skipped
         assert result.success
 
-    def test_execute_commands_sequential(self, tmp_path):
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_skip_until_exists_sees_file_from_earlier_command(
+        self, tmp_path, session_loop, parallel
+    ):
+        """Test that queued commands see files created by earlier ones."""
+
+        async def run_test():
+            # One slot, so the parallel pool also runs "consume" after "create"
+            executor = CommandExecutor(max_parallel=1)
+            commands = [
+                Command(
+                    name="create",
+                    cmd=[sys.executable, "-c", "open('made.txt', 'w').close()"],
+                ),
+                Command(
+                    name="consume",
+                    cmd=get_echo_command("done"),
+                    skip_until_exists="made.txt",
+                ),
+            ]
+
+            return await executor.execute_commands(
+                commands=commands,
+                template_vars={},
+                project_root=tmp_path,
+                parallel=parallel,
+            )
+
+        results = session_loop.run_until_complete(run_test())
+
+        assert results[0].success
+        assert not results[1].skipped
+        assert results[1].success
+
+    def test_execute_commands_sequential(self, tmp_path, session_loop):
         """Test executing multiple commands sequentially."""
 
         async def run_test():
@@ -217,7 +338,7 @@ class TestCommandExecutor:
             )
             return results
 
-        results = asyncio.run(run_test())
+        results = session_loop.run_until_complete(run_test())
 
         assert len(results) == 3
         assert all(r.success for r in results)
@@ -225,7 +346,7 @@ class TestCommandExecutor:
         assert results[1].command_name == "cmd2"
         assert results[2].command_name == "cmd3"
 
-    def test_execute_commands_parallel(self, tmp_path):
+    def test_execute_commands_parallel(self, tmp_path, session_loop):
         """Test executing multiple commands in parallel."""
 
         async def run_test():
@@ -244,12 +365,12 @@ class TestCommandExecutor:
             )
             return results
 
-        results = asyncio.run(run_test())
+        results = session_loop.run_until_complete(run_test())
 
         assert len(results) == 3
         assert all(r.success for r in results)
 
-    def test_max_parallel_limit(self, tmp_path):
+    def test_max_parallel_limit(self, tmp_path, session_loop):
         """Test that max parallel limit is respected."""
 
         async def run_test():
@@ -268,12 +389,38 @@ class TestCommandExecutor:
             )
             return results
 
-        results = asyncio.run(run_test())
+        results = session_loop.run_until_complete(run_test())
 
         assert len(results) == 10
         assert all(r.success for r in results)
+        assert [r.command_name for r in results] == [f"cmd{i}" for i in range(10)]
+
+    def test_execute_commands_parallel_raises_worker_error(
+        self, tmp_path, session_loop, monkeypatch
+    ):
+        """Test that a failing parallel command raises its own exception."""
+        executor = CommandExecutor()
+
+        async def fail(command, *args, **kwargs):
+            raise CommandExecutionError(command.name, 2)
+
+        monkeypatch.setattr(executor, "execute_command", fail)
+        commands = [
+            Command(name="cmd1", cmd=get_echo_command("1")),
+            Command(name="cmd2", cmd=get_echo_command("2")),
+        ]
+
+        with pytest.raises(CommandExecutionError):
+            session_loop.run_until_complete(
+                executor.execute_commands(
+                    commands=commands,
+                    template_vars={},
+                    project_root=tmp_path,
+                    parallel=True,
+                )
+            )
 
-    def test_intelligent_test_skip(self, tmp_path):
+    def test_intelligent_test_skip(self, tmp_path, session_loop):
         """Test intelligent test skipping when no tests exist."""
 
         async def run_test():
@@ -290,12 +437,12 @@ class TestCommandExecutor:
             )
             return result
 
-        result = asyncio.run(run_test())
+        result = session_loop.run_until_complete(run_test())
 
         assert result.skipped
         assert "no test" in result.skip_reason.lower()
 
-    def test_no_skip_when_tests_exist(self, tmp_path):
+    def test_no_skip_when_tests_exist(self, tmp_path, session_loop):
         """Test that tests run when test directory exists."""
         tests_dir = tmp_path / "tests"
         tests_dir.mkdir()
@@ -314,7 +461,7 @@ class TestCommandExecutor:
             )
             return result
 
-        result = asyncio.run(run_test())
+        result = session_loop.run_until_complete(run_test())
 
         assert not result.skipped
         assert result.success
@@ -342,3 +489,14 @@ class TestCommandExecutor:
         assert delay0 == 1
         assert delay1 == 2
         assert delay2 == 4
+
+    def test_retry_delay_exponential_cap(self):
+        """Test that exponential retry delay is capped at 60 seconds."""
+        executor = CommandExecutor()
+
+        delays = [
+            executor._calculate_retry_delay(attempt, RetryStrategy.EXPONENTIAL)
+            for attempt in range(12)
+        ]
+
+        assert delays == [min(2**attempt, 60) for attempt in range(12)]
@@ -1,8 +1,10 @@
 """Tests for new features added to WatchFlow."""
 
-import asyncio
+import hashlib
+import os
 import sys
 
+import pytest
 
 from watchflow.core.executor import (
     CommandExecutor,
@@ -38,7 +40,7 @@ class TestFileHashDetection:
 
         hash_result = compute_file_hash(str(test_file))
         assert hash_result is not None
-        assert len(hash_result) == 32  # MD5 hex digest length
+        assert len(hash_result) == 64  # SHA-256 hex digest length
 
     def test_compute_file_hash_consistent(self, tmp_path):
         """Test that same content produces same hash."""
@@ -68,12 +70,27 @@ class TestFileHashDetection:
     def test_compute_file_hash_large_file(self, tmp_path):
         """Test hash computation for larger files."""
         test_file = tmp_path / "large.txt"
-        # Create a file larger than the chunk size (8192 bytes)
+        # Create a file larger than a single read buffer
         test_file.write_text("x" * 20000)
 
         hash_result = compute_file_hash(str(test_file))
         assert hash_result is not None
-        assert len(hash_result) == 32
+        assert len(hash_result) == 64
+
+    def test_compute_file_hash_matches_content(self, tmp_path):
+        """Test that streamed hashing matches a plain digest."""
+        content = b"watchflow" * 10000  # Larger than one read buffer
+        test_file = tmp_path / "large.bin"
+        test_file.write_bytes(content)
+
+        assert compute_file_hash(str(test_file)) == hashlib.sha256(content).hexdigest()
+
+    def test_compute_file_hash_empty_file(self, tmp_path):
+        """Test hashing an empty file."""
+        test_file = tmp_path / "empty.txt"
+        test_file.touch()
+
+        assert compute_file_hash(str(test_file)) == hashlib.sha256().hexdigest()
 
 
 class TestCommandValidation:
@@ -90,6 +107,57 @@ class TestCommandValidation:
         result = find_command("nonexistent_command_12345")
         assert result is None
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX executable bit")
+    def test_find_command_sees_newly_installed_tool(self, tmp_path, monkeypatch):
+        """Test that misses aren't cached, so new commands are found."""
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert find_command("watchflow_fake_tool") is None
+
+        tool = tmp_path / "watchflow_fake_tool"
+        tool.write_text("#!/bin/sh\n")
+        tool.chmod(0o755)
+        assert find_command("watchflow_fake_tool") == str(tool)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX executable bit")
+    def test_find_command_relative_path_entry_follows_cwd(self, tmp_path, monkeypatch):
+        """Test that relative PATH entries are resolved against the cwd."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        for project in (first, second):
+            (project / "bin").mkdir(parents=True)
+        tool = second / "bin" / "watchflow_local_tool"
+        tool.write_text("#!/bin/sh\n")
+        tool.chmod(0o755)
+
+        monkeypatch.setenv("PATH", "bin")
+        monkeypatch.chdir(first)
+        assert find_command("watchflow_local_tool") is None
+
+        monkeypatch.chdir(second)
+        assert find_command("watchflow_local_tool") == os.path.join(
+            "bin", "watchflow_local_tool"
+        )
+        monkeypatch.chdir(first)
+        assert find_command("watchflow_local_tool") is None
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX executable bit")
+    def test_find_command_follows_path_changes(self, tmp_path, monkeypatch):
+        """Test that lookups skip non-executables and follow PATH changes."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        (first / "watchflow_tool").write_text("not executable")
+        tool = second / "watchflow_tool"
+        tool.write_text("#!/bin/sh\n")
+        tool.chmod(0o755)
+
+        monkeypatch.setenv("PATH", str(first))
+        assert find_command("watchflow_tool") is None
+
+        monkeypatch.setenv("PATH", os.pathsep.join([str(first), str(second)]))
+        assert find_command("watchflow_tool") == str(tool)
+
     def test_validate_command_empty(self):
         """Test validating empty command list."""
         is_valid, error = validate_command([])
@@ -130,7 +198,7 @@ class TestCommandValidation:
 class TestCommandExecutorValidation:
     """Tests for CommandExecutor with validation."""
 
-    def test_executor_validates_commands(self, tmp_path):
+    def test_executor_validates_commands(self, tmp_path, session_loop):
         """Test that executor validates commands before running."""
         from watchflow.config import Command
 
@@ -145,14 +213,14 @@ class TestCommandExecutorValidation:
             )
             return result
 
-        result = asyncio.run(run_test())
+        result = session_loop.run_until_complete(run_test())
 
         # On Windows, we skip validation due to shell=True
         if sys.platform != "win32":
             assert not result.success
             assert "not found" in result.stderr.lower()
 
-    def test_executor_skips_validation_when_disabled(self, tmp_path):
+    def test_executor_skips_validation_when_disabled(self, tmp_path, session_loop):
         """Test that executor can skip validation."""
         from watchflow.config import Command
 
@@ -171,7 +239,7 @@ class TestCommandExecutorValidation:
             )
             return result
 
-        result = asyncio.run(run_test())
+        result = session_loop.run_until_complete(run_test())
         assert result.success
 
 
@@ -1,6 +1,12 @@
 """Tests for template engine."""
 
-from watchflow.utils.templates import CONFIG_TEMPLATES, TemplateEngine
+from datetime import datetime
+
+from watchflow.utils.templates import (
+    CONFIG_TEMPLATES,
+    TemplateEngine,
+    render_config,
+)
 
 
 class TestTemplateEngine:
@@ -51,6 +57,17 @@ class TestTemplateEngine:
         result = TemplateEngine.substitute(template, variables)
         assert result == ""
 
+    def test_substitute_whole_placeholder(self):
+        """Test templates that are exactly one placeholder."""
+        variables = {"path": "src/app.py", "my_var": 3}
+
+        assert TemplateEngine.substitute("{{path}}", variables) == "src/app.py"
+        assert TemplateEngine.substitute("{{my_var}}", variables) == "3"
+        assert TemplateEngine.substitute("{{other}}", variables) == "{{other}}"
+        assert TemplateEngine.substitute("{{path}}{{path}}", variables) == (
+            "src/app.pysrc/app.py"
+        )
+
     def test_substitute_list(self):
         """Test substituting list of templates."""
         templates = ["Hello {{name}}", "Goodbye {{name}}"]
@@ -59,6 +76,14 @@ class TestTemplateEngine:
         results = TemplateEngine.substitute_list(templates, variables)
         assert results == ["Hello World", "Goodbye World"]
 
+    def test_substitute_list_mixed_literals(self):
+        """Test substituting list where some entries have no placeholders."""
+        templates = ["pytest", "-k", "{{name}}", "--verbose"]
+        variables = {"name": "test_watch"}
+
+        results = TemplateEngine.substitute_list(templates, variables)
+        assert results == ["pytest", "-k", "test_watch", "--verbose"]
+
     def test_create_context(self):
         """Test creating template context."""
         context = TemplateEngine.create_context(
@@ -73,6 +98,8 @@ class TestTemplateEngine:
         assert context["event"] == "modified"
         assert context["watcher"] == "test-watcher"
         assert "timestamp" in context
+        # Timestamp must remain a valid ISO-8601 local time
+        assert datetime.fromisoformat(context["timestamp"])
 
     def test_substitute_with_path(self):
         """Test path substitution in command."""
@@ -153,3 +180,11 @@ class TestConfigTemplates:
         assert "black" in result
         assert "ruff" in result
         assert "pytest" in result
+
+    def test_render_config_matches_substitute(self):
+        """Test that precompiled templates render like substitute()."""
+        variables = {"project_name": '"demo"', "build_cmd": '"gradle"'}
+        for language, template in CONFIG_TEMPLATES.items():
+            assert render_config(language, variables) == TemplateEngine.substitute(
+                template, variables
+            )
@@ -1,9 +1,12 @@
 """Tests for tool detection."""
 
+import subprocess
 import sys
+from dataclasses import FrozenInstanceError
 
 import pytest
 
+from watchflow.detection import tools as tools_module
 from watchflow.detection.tools import ToolDetector
 
 
@@ -31,6 +34,58 @@ class TestToolDetector:
         assert info.available
         # Version may or may not be detected depending on echo implementation
 
+    def test_check_tool_cache_returns_fresh_info(self):
+        """Test that cached checks don't share ToolInfo instances."""
+        first = ToolDetector.check_tool("nonexistent_tool_12345", install_hint="a")
+        with pytest.raises(FrozenInstanceError):
+            first.install_hint = "changed"  # type: ignore[misc]
+
+        second = ToolDetector.check_tool("nonexistent_tool_12345")
+        assert second is not first
+        assert first.install_hint == "a"
+        assert second.install_hint is None
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX executable bit")
+    def test_check_tool_sees_newly_installed_tool(self, tmp_path, monkeypatch):
+        """Test that misses aren't cached, so new tools are found."""
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert not ToolDetector.check_tool("watchflow_fake_tool").available
+
+        tool = tmp_path / "watchflow_fake_tool"
+        tool.write_text("#!/bin/sh\n")
+        tool.chmod(0o755)
+
+        assert ToolDetector.check_tool("watchflow_fake_tool").available
+
+    def test_check_missing_tool_spawns_nothing(self, monkeypatch):
+        """Test that a tool missing from PATH is reported without a subprocess."""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("missing tools must not be executed")
+
+        monkeypatch.setattr(subprocess, "run", fail)
+        info = ToolDetector.check_tool("nonexistent_tool_67890", "x --version")
+        assert not info.available
+        assert info.version is None
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="echo is built-in on Windows")
+    def test_version_probe_discards_stderr(self, monkeypatch):
+        """Test that version probes only open a pipe for stdout."""
+        calls = []
+
+        def fake_run(args, **kwargs):
+            calls.append(kwargs)
+            return subprocess.CompletedProcess(args, 0, stdout="echo 1.0\n")
+
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        ToolDetector.clear_cache()
+        info = ToolDetector.check_tool("echo", "echo --watchflow-probe")
+
+        assert info.version == "echo 1.0"
+        assert calls[0]["stdout"] == subprocess.PIPE
+        assert calls[0]["stderr"] == subprocess.DEVNULL
+        ToolDetector.clear_cache()
+
     def test_check_language_tools_python(self):
         """Test checking Python tools."""
         tools = ToolDetector.check_language_tools("python")
@@ -39,6 +94,16 @@ class TestToolDetector:
         tool_names = [t.name for t in tools]
         assert "python" in tool_names
 
+    def test_check_language_tools_cached_skips_thread_pool(self, monkeypatch):
+        """Test that warm tool checks don't start worker threads."""
+        first = ToolDetector.check_language_tools("python")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("cached probes must not start a thread pool")
+
+        monkeypatch.setattr(tools_module, "ThreadPoolExecutor", fail)
+        assert ToolDetector.check_language_tools("python") == first
+
     def test_check_language_tools_nodejs(self):
         """Test checking Node.js tools."""
         tools = ToolDetector.check_language_tools("nodejs")
@@ -74,7 +139,11 @@ class TestToolDetector:
         # Use 'sh' which should be available on most systems
         class MockDetector(ToolDetector):
             TOOL_REQUIREMENTS = {
-                "test": [("sh", "sh --version", "Install sh")],
+                "test": {
+                    "names": ("sh",),
+                    "version_cmds": ("sh --version",),
+                    "hints": ("Install sh",),
+                },
             }
 
         missing = MockDetector.get_missing_tools("test")
@@ -86,15 +155,20 @@ class TestToolDetector:
 
         class MockDetector(ToolDetector):
             TOOL_REQUIREMENTS = {
-                "test": [
-                    ("nonexistent_1", "nonexistent_1 --version", "Install it"),
-                    ("nonexistent_2", "nonexistent_2 --version", "Install it"),
-                ],
+                "test": {
+                    "names": ("nonexistent_1", "nonexistent_2"),
+                    "version_cmds": (
+                        "nonexistent_1 --version",
+                        "nonexistent_2 --version",
+                    ),
+                    "hints": ("Install it", "Install it"),
+                },
             }
 
         missing = MockDetector.get_missing_tools("test")
         assert len(missing) == 2
         assert all(not t.available for t in missing)
+        assert all(t.install_hint == "Install it" for t in missing)
 
     def test_tool_requirements_structure(self):
         """Test that tool requirements have correct structure."""
@@ -103,10 +177,19 @@ class TestToolDetector:
         # Check Python tools
         assert "python" in requirements
         python_tools = requirements["python"]
-        assert len(python_tools) > 0
-
-        # Each tool should be a tuple of 3 elements
-        for tool_name, version_cmd, install_hint in python_tools:
+        assert len(python_tools["names"]) > 0
+
+        # Every language has one version command and install hint per tool
+        for tools in requirements.values():
+            assert len(tools["names"]) == len(tools["version_cmds"])
+            assert len(tools["names"]) == len(tools["hints"])
+
+        for tool_name, version_cmd, install_hint in zip(
+            python_tools["names"],
+            python_tools["version_cmds"],
+            python_tools["hints"],
+            strict=True,
+        ):
             assert isinstance(tool_name, str)
             assert isinstance(version_cmd, str)
             assert isinstance(install_hint, str)
@@ -1,10 +1,13 @@
 """Tests for UI components."""
 
+from dataclasses import FrozenInstanceError
+
+import pytest
 from rich.console import Console
 
 from watchflow.detection import ProjectDetection
 from watchflow.detection.tools import ToolInfo
-from watchflow.ui import Icons, Themes, UIRenderer
+from watchflow.ui import Icons, Themes, UIRenderer, themes
 
 
 class TestThemes:
@@ -47,6 +50,24 @@ class TestThemes:
         theme = Themes.get_theme("unknown")
         assert theme.name == "pro"
 
+    def test_rich_theme_shared_across_variants(self):
+        """Test that theme variants with the same styles share a Rich theme."""
+        safe_pro = Themes._get_safe_pro_theme()
+        assert safe_pro.rich_theme is Themes.PRO.rich_theme
+        assert "success" in safe_pro.rich_theme.styles
+
+    def test_get_theme_returns_shared_instances(self, monkeypatch):
+        """Test that built-in themes and their emoji-free variants are reused."""
+        monkeypatch.setattr(themes, "_can_display_emoji", lambda: False)
+        first = Themes.get_theme("neon")
+        second = Themes.get_theme("NEON")
+
+        assert first is second
+        assert not first.use_emoji
+        assert first.styles is Themes.NEON.styles
+        with pytest.raises(FrozenInstanceError):
+            first.use_emoji = True  # type: ignore[misc]
+
 
 class TestIcons:
     """Tests for icon system."""
@@ -85,6 +106,12 @@ class TestUIRenderer:
         assert renderer.theme.name == "pro"
         assert isinstance(renderer.console, Console)
 
+    def test_renderers_share_console_per_theme(self):
+        """Test that renderers with the same theme reuse one console."""
+        first = UIRenderer(theme_name="minimal")
+        second = UIRenderer(theme_name="minimal")
+        assert first.console is second.console
+
     def test_print_banner(self, capsys):
         """Test printing banner."""
         renderer = UIRenderer(theme_name="minimal")
@@ -125,6 +152,36 @@ class TestUIRenderer:
         renderer.print_tool_status(tools)
         # Should not crash
 
+    def test_print_tool_status_prints_rows_once(self, capsys, monkeypatch):
+        """Test that all tool rows are written in a single console call."""
+        renderer = UIRenderer(theme_name="minimal")
+        tools = [
+            ToolInfo(name="python", available=True, version="3.11.0"),
+            ToolInfo(name="black", available=False, install_hint="pip install black"),
+        ]
+        calls = []
+        original = renderer.console.print
+        monkeypatch.setattr(
+            renderer.console,
+            "print",
+            lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs),
+        )
+
+        renderer.print_tool_status(tools)
+
+        # One call for the heading and one for the rows
+        assert len(calls) == 2
+        rows = calls[1][0]
+        assert any(span.style == "repr.number" for span in rows.spans)
+        output = capsys.readouterr().out
+        assert "python (3.11.0)" in output
+        assert "pip install black" in output
+
+    def test_print_tool_status_empty_prints_nothing(self, capsys):
+        """Test that an empty tool list produces no output."""
+        UIRenderer(theme_name="minimal").print_tool_status([])
+        assert capsys.readouterr().out == ""
+
     def test_print_file_event(self):
         """Test printing file event."""
         renderer = UIRenderer(theme_name="minimal")
@@ -164,6 +221,11 @@ class TestUIRenderer:
         assert len(truncated) == 20
         assert truncated.endswith("...")
 
+    def test_truncate_exact_length(self):
+        """Test that text exactly at the limit is left alone."""
+        assert UIRenderer._truncate("x" * 20, 20) == "x" * 20
+        assert UIRenderer._truncate("x" * 21, 20) == "x" * 17 + "..."
+
     def test_get_layout_mode_full(self):
         """Test layout mode detection for full width."""
         renderer = UIRenderer(theme_name="minimal")
@@ -186,6 +248,14 @@ class TestUIRenderer:
         mode = renderer._get_layout_mode()
         assert mode == "minimal"
 
+    def test_get_layout_mode_follows_width_changes(self):
+        """Test that the cached layout mode is recomputed on resize."""
+        renderer = UIRenderer(theme_name="minimal")
+        renderer.terminal_width = 100
+        assert renderer._get_layout_mode() == "full"
+        renderer.terminal_width = 50
+        assert renderer._get_layout_mode() == "minimal"
+
     def test_print_validation_errors(self):
         """Test printing validation errors."""
         renderer = UIRenderer(theme_name="minimal")
@@ -2,6 +2,15 @@
 
 import sys
 
+# Resolved once at import; the helpers below only build the argument list
+_WIN = sys.platform == "win32"
+
+_ECHO = ("cmd", "/c", "echo") if _WIN else ("echo",)
+# Use echo %CD% to print current directory on Windows
+_PWD = ("cmd", "/c", "echo", "%CD%") if _WIN else ("pwd",)
+_FALSE = ("cmd", "/c", "exit", "1") if _WIN else ("false",)
+_TRUE = ("cmd", "/c", "exit", "0") if _WIN else ("true",)
+
 
 def get_echo_command(text: str) -> list[str]:
     """Get platform-specific echo command.
@@ -12,10 +21,7 @@ def get_echo_command(text: str) -> list[str]:
     Returns:
         Command list
     """
-    if sys.platform == "win32":
-        return ["cmd", "/c", "echo", text]
-    else:
-        return ["echo", text]
+    return [*_ECHO, text]
 
 
 def get_sleep_command(seconds: int) -> list[str]:
@@ -27,12 +33,11 @@ def get_sleep_command(seconds: int) -> list[str]:
     Returns:
         Command list
     """
-    if sys.platform == "win32":
+    if _WIN:
         # Windows: use ping command as a sleep alternative (more reliable than timeout)
         # ping localhost with count n takes approximately n seconds
         return ["cmd", "/c", "ping", "127.0.0.1", "-n", str(seconds + 1), ">", "nul"]
-    else:
-        return ["sleep", str(seconds)]
+    return ["sleep", str(seconds)]
 
 
 def get_pwd_command() -> list[str]:
@@ -41,11 +46,7 @@ def get_pwd_command() -> list[str]:
     Returns:
         Command list
     """
-    if sys.platform == "win32":
-        # Use echo %CD% to print current directory on Windows
-        return ["cmd", "/c", "echo", "%CD%"]
-    else:
-        return ["pwd"]
+    return list(_PWD)
 
 
 def get_false_command() -> list[str]:
@@ -54,10 +55,7 @@ def get_false_command() -> list[str]:
     Returns:
         Command list
     """
-    if sys.platform == "win32":
-        return ["cmd", "/c", "exit", "1"]
-    else:
-        return ["false"]
+    return list(_FALSE)
 
 
 def get_true_command() -> list[str]:
@@ -66,7 +64,4 @@ def get_true_command() -> list[str]:
     Returns:
         Command list
     """
-    if sys.platform == "win32":
-        return ["cmd", "/c", "exit", "0"]
-    else:
-        return ["true"]
+    return list(_TRUE)